@@ -1,16 +1,40 @@
-from flask import Flask, jsonify, request, render_template, redirect, url_for, session
+from flask import Flask, Response, g, has_request_context, jsonify, make_response, request, render_template, redirect, url_for, session
 from flask_cors import CORS
 import requests
 import time
 import threading
+import logging
 from slack_bolt import App
 from slack_bolt.adapter.flask import SlackRequestHandler
+from slack_bolt.middleware.authorization import SingleTeamAuthorization
 from apscheduler.schedulers.background import BackgroundScheduler
+from concurrent.futures import ThreadPoolExecutor, wait
 import os
-import json
 import atexit
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import secrets
+from slack_dispatch import BoundedExecutor, SessionSlackClient, SlackDispatcher
+from slack_profiles import SlackProfileCache
+from tracked_store import create_tracked_user_store
+from message_pool import MessagePool
+from notification_outbox import SqliteNotificationOutbox
+from delivery_log import SqliteDeliveryLog
+from metrics import Counter, Gauge, MetricsRegistry
+from poll_cadence import AdaptiveCadence
+from shared_state import LeaderLock, SharedSnapshotFile
+from snapshot import STATUS_MISSING, build_snapshot, diff_status_codes, export_tables, import_snapshot, iter_submissions, slack_id_slots, slot_slack_ids, status_values
+import hashlib
+import functools
+import math
+import gzip
+import json
+import sqlite3
+from urllib.parse import parse_qs
+from requests.adapters import HTTPAdapter
+from werkzeug.middleware.proxy_fix import ProxyFix
+from ttl_cache import TTLCache
+from status_stream import StatusStreamHub
+from rate_limit import RateLimiter
 
 def load_env_file():
     try:
@@ -25,89 +49,829 @@ def load_env_file():
 
 load_env_file()
 
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+logging.basicConfig(format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+logger = logging.getLogger('statusbuddy')
+logger.setLevel(logging.CRITICAL + 1 if LOG_LEVEL == 'OFF' else LOG_LEVEL)
+
 app = Flask(__name__)
 CORS(app)
-app.secret_key = os.environ.get("FLASK_SECRET_KEY", secrets.token_hex(16))
+FLASK_SECRET_KEY = os.environ.get("FLASK_SECRET_KEY")
+# A random key only works in a single process; create_app() refuses to start several workers without one
+app.secret_key = FLASK_SECRET_KEY or secrets.token_hex(16)
+# Number of reverse proxies in front of the app whose X-Forwarded-For is trusted for the client IP
+TRUSTED_PROXY_COUNT = int(os.environ.get("TRUSTED_PROXY_COUNT", "0"))
+if TRUSTED_PROXY_COUNT:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXY_COUNT)
 
 SLACK_BOT_TOKEN = os.environ.get("SLACK_BOT_TOKEN")
 SLACK_SIGNING_SECRET = os.environ.get("SLACK_SIGNING_SECRET")
+SLACK_API_URL = os.environ.get("SLACK_API_URL", "https://slack.com/api/")
+AI_COMPLETIONS_URL = os.environ.get("AI_COMPLETIONS_URL", "https://ai.hackclub.com/chat/completions")
 
-if not SLACK_BOT_TOKEN:
-    raise ValueError("SLACK_BOT_TOKEN environment variable is required")
-if not SLACK_SIGNING_SECRET:
-    raise ValueError("SLACK_SIGNING_SECRET environment variable is required")
+metrics_registry = MetricsRegistry(prefix='statusbuddy_')
+submissions_cache_lookups = metrics_registry.counter(
+    'submissions_cache_lookups_total', "Submissions cache lookups by source and result (fresh, stale, miss)",
+    ['source', 'result'])
+submissions_fetches = metrics_registry.counter(
+    'submissions_fetches_total', "Upstream submissions fetches by source and outcome", ['source', 'outcome'])
+submissions_fetch_seconds = metrics_registry.histogram(
+    'submissions_fetch_seconds', "Time to fetch and parse a submissions feed", ['source'])
+status_check_seconds = metrics_registry.histogram(
+    'status_check_seconds', "Duration of a check_status_changes() cycle",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0))
+status_check_cycles = metrics_registry.counter(
+    'status_check_cycles_total', "Status check cycles by outcome", ['outcome'])
+status_check_users_checked = metrics_registry.gauge(
+    'status_check_users_checked', "Tracked users whose status was compared in the last cycle, by source", ['source'])
+status_check_changes = metrics_registry.counter(
+    'status_check_changes_total', "Status changes found by check_status_changes(), by source", ['source'])
+status_check_interval = metrics_registry.gauge(
+    'status_check_interval_seconds', "Delay until the next status check, after jitter")
+slack_call_seconds = metrics_registry.histogram(
+    'slack_api_call_seconds', "Slack Web API call latency by method", ['method'])
+slack_call_errors = metrics_registry.counter(
+    'slack_api_errors_total', "Failed Slack Web API call attempts by method", ['method'])
+ai_request_seconds = metrics_registry.histogram(
+    'ai_request_seconds', "AI completion request latency")
+ai_requests = metrics_registry.counter(
+    'ai_requests_total', "AI completion requests by outcome", ['outcome'])
+ai_messages = metrics_registry.counter(
+    'ai_messages_total', "Notification messages by source (pool, fallback)", ['source'])
+http_request_seconds = metrics_registry.histogram(
+    'http_request_seconds', "Web request latency by route", ['route', 'method', 'status'])
+slack_listener_wait_seconds = metrics_registry.histogram(
+    'slack_listener_wait_seconds', "Time Slack listener work waits for a background worker")
+slack_listener_seconds = metrics_registry.histogram(
+    'slack_listener_seconds', "Duration of Slack listener work run after the ack", ['outcome'])
+home_tab_publishes = metrics_registry.counter(
+    'home_tab_publishes_total', "Home tab publishes by result (published, skipped as unchanged)", ['result'])
+notifications = metrics_registry.counter(
+    'notifications_total', "Outbox notifications by outcome (enqueued, already_delivered, delivered, "
+    "coalesced, discarded, retried, parked)", ['outcome'])
+notification_batch_seconds = metrics_registry.histogram(
+    'notification_batch_seconds', "Time to deliver one batch of outbox notifications")
+slack_deliveries = metrics_registry.counter(
+    'slack_deliveries_total', "Slack requests by delivery key kind and whether they were duplicates", ['kind', 'duplicate'])
+rate_limit_requests = metrics_registry.counter(
+    'rate_limit_requests_total', "Rate limited route requests by result (allowed, ip_limited, session_limited)",
+    ['route', 'result'])
 
-slack_app = App(
-    token=SLACK_BOT_TOKEN,
-    signing_secret=SLACK_SIGNING_SECRET,
-    process_before_response=True
+def record_slack_listener(waited, elapsed, error):
+    slack_listener_wait_seconds.observe(waited)
+    slack_listener_seconds.observe(elapsed, 'error' if error else 'ok')
+
+SLACK_LISTENER_WORKERS = int(os.environ.get("SLACK_LISTENER_WORKERS", "8"))
+SLACK_LISTENER_QUEUE = int(os.environ.get("SLACK_LISTENER_QUEUE", "256"))
+SLACK_DEDUPE_TTL = int(os.environ.get("SLACK_DEDUPE_TTL", "900"))
+SLACK_DEDUPE_SIZE = int(os.environ.get("SLACK_DEDUPE_SIZE", "10000"))
+HOME_VIEW_CACHE_SIZE = int(os.environ.get("HOME_VIEW_CACHE_SIZE", "10000"))
+HOME_VIEW_CACHE_TTL = int(os.environ.get("HOME_VIEW_CACHE_TTL", str(24 * 60 * 60)))
+GZIP_MIN_SIZE = int(os.environ.get("GZIP_MIN_SIZE", "512"))
+GZIP_MIMETYPES = {'application/json', 'text/html', 'text/plain', 'text/css', 'application/javascript'}
+STATUS_BATCH_MAX = int(os.environ.get("STATUS_BATCH_MAX", "1000"))
+SSE_MAX_STREAMS = int(os.environ.get("SSE_MAX_STREAMS", "24"))
+SSE_HEARTBEAT = float(os.environ.get("SSE_HEARTBEAT", "25"))
+SSE_MAX_DURATION = float(os.environ.get("SSE_MAX_DURATION", str(15 * 60)))
+# Comma-separated route=requests/seconds budgets per client IP and per session, over DEFAULT_RATE_LIMITS;
+# route=0 lifts one limit and "off" lifts them all
+RATE_LIMITS = os.environ.get("RATE_LIMITS", "")
+RATE_LIMIT_MAX_BUCKETS = int(os.environ.get("RATE_LIMIT_MAX_BUCKETS", "50000"))
+DEFAULT_RATE_LIMITS = {
+    'status': (120, 60),
+    'status_batch': (20, 60),
+    'dashboard': (60, 60),
+    'track': (10, 60),
+    'manual_login': (10, 60)
+}
+SLACK_PROFILE_CACHE_SIZE = int(os.environ.get("SLACK_PROFILE_CACHE_SIZE", "10000"))
+SLACK_PROFILE_CACHE_TTL = int(os.environ.get("SLACK_PROFILE_CACHE_TTL", str(6 * 60 * 60)))
+SLACK_PROFILE_NEGATIVE_TTL = int(os.environ.get("SLACK_PROFILE_NEGATIVE_TTL", str(10 * 60)))
+SLACK_PROFILE_TIMEOUT = float(os.environ.get("SLACK_PROFILE_TIMEOUT", "5"))
+SLACK_PROFILE_LOGIN_TIMEOUT = float(os.environ.get("SLACK_PROFILE_LOGIN_TIMEOUT", "1.5"))
+SLACK_PROFILE_WARMUP = os.environ.get("SLACK_PROFILE_WARMUP", "").lower() in ('1', 'true', 'yes')
+slack_listener_executor = BoundedExecutor(
+    max_workers=SLACK_LISTENER_WORKERS,
+    max_queue=SLACK_LISTENER_QUEUE,
+    thread_name_prefix='slack-listener',
+    on_record=record_slack_listener
 )
 
-handler = SlackRequestHandler(slack_app)
+# The Bolt app and its Flask handler, built by create_app() once the Slack credentials are checked
+slack_state = {'app': None, 'handler': None}
+# (kind, args, fn) for every listener, registered on the Bolt app when it is built
+slack_listeners = []
+
+def ack_request(ack):
+    ack()
+
+def slack_listener(kind, *args):
+    """Register fn as lazy work behind an immediate ack, e.g. slack_listener('command', '/list')"""
+    def decorator(fn):
+        slack_listeners.append((kind, args, fn))
+        return fn
+    return decorator
+
+def build_slack_app():
+    """Build the Bolt app with every listener; listeners only ack on the request thread, their work runs on slack_listener_executor"""
+    slack_app = App(
+        token=SLACK_BOT_TOKEN,
+        signing_secret=SLACK_SIGNING_SECRET,
+        process_before_response=True,
+        listener_executor=slack_listener_executor,
+        # create_app() resolves the bot's identity in the background instead
+        token_verification_enabled=False
+    )
+    # Bolt builds its own client from the token, and each request's client copies this base URL
+    slack_app.client.base_url = SLACK_API_URL
+    slack_app.middleware(remember_bot_identity)
+    for kind, args, fn in slack_listeners:
+        getattr(slack_app, kind)(*args)(ack=ack_request, lazy=[fn])
+    return slack_app
+
+def get_slack_client():
+    return slack_state['app'].client
+
+
+def record_slack_call(method, elapsed, error):
+    slack_call_seconds.observe(elapsed, method)
+    if error:
+        slack_call_errors.inc(method)
+
+SLACK_DISPATCH_WORKERS = int(os.environ.get("SLACK_DISPATCH_WORKERS", "8"))
+slack_dispatcher = SlackDispatcher(max_workers=SLACK_DISPATCH_WORKERS, on_record=record_slack_call)
+
+def slack_call(client, method, **kwargs):
+    return slack_dispatcher.call(client, method, **kwargs)
 
 TRACKED_USERS_FILE = 'tracked_users.json'
-submissions_cache = {
-    'data': None,
-    'last_updated': None,
-    'cache_duration': timedelta(minutes=2)
-}
+SUBMISSIONS_URL = os.environ.get("SUBMISSIONS_URL", "https://adventure-time.hackclub.dev/api/getYSWSSubmissions")
+# Comma-separated name=url entries, each optionally followed by |ttl_seconds; the first is the default source
+SUBMISSION_SOURCES = os.environ.get("SUBMISSION_SOURCES", f"neighbourhood={SUBMISSIONS_URL}")
+SUBMISSIONS_FETCH_TIMEOUT = float(os.environ.get("SUBMISSIONS_FETCH_TIMEOUT", "15"))
+SUBMISSIONS_CHUNK_SIZE = 64 * 1024
+AI_MESSAGE_VARIANTS = int(os.environ.get("AI_MESSAGE_VARIANTS", "3"))
+AI_MESSAGE_TTL = int(os.environ.get("AI_MESSAGE_TTL", str(6 * 60 * 60)))
+AI_MESSAGE_POOL_SIZE = int(os.environ.get("AI_MESSAGE_POOL_SIZE", "64"))
+SUBMISSIONS_BACKGROUND_REFRESH = os.environ.get("SUBMISSIONS_BACKGROUND_REFRESH", "").lower() in ('1', 'true', 'yes')
+SHARED_SNAPSHOT_POLL_INTERVAL = float(os.environ.get("SHARED_SNAPSHOT_POLL_INTERVAL", "1"))
+# Settings create_app() may override, because nothing reads them before startup
+app.config.update(
+    TRACKED_USERS_STORE=os.environ.get("TRACKED_USERS_STORE", "sqlite"),
+    TRACKED_USERS_DB=os.environ.get("TRACKED_USERS_DB", "tracked_users.db"),
+    # Defaults to notification_outbox.db next to TRACKED_USERS_DB; a separate file keeps outbox writes
+    # from looking like tracked user changes to the other workers
+    NOTIFICATION_OUTBOX_DB=os.environ.get("NOTIFICATION_OUTBOX_DB"),
+    SHARED_STATE_DIR=os.environ.get("SHARED_STATE_DIR", "."),
+    # Defaults to SHARED_STATE_DIR/submissions.snapshot; an empty value disables it
+    SUBMISSIONS_SNAPSHOT_FILE=os.environ.get("SUBMISSIONS_SNAPSHOT_FILE"),
+    WEB_WORKERS=int(os.environ.get("WEB_WORKERS", "1"))
+)
+NOTIFICATION_BATCH_SIZE = int(os.environ.get("NOTIFICATION_BATCH_SIZE", "50"))
+NOTIFICATION_MAX_ATTEMPTS = int(os.environ.get("NOTIFICATION_MAX_ATTEMPTS", "8"))
+NOTIFICATION_RETRY_BASE = float(os.environ.get("NOTIFICATION_RETRY_BASE", "30"))
+NOTIFICATION_DRAIN_INTERVAL = float(os.environ.get("NOTIFICATION_DRAIN_INTERVAL", "15"))
+STATUS_CHECK_MIN_INTERVAL = float(os.environ.get("STATUS_CHECK_MIN_INTERVAL", "60"))
+STATUS_CHECK_MAX_INTERVAL = float(os.environ.get("STATUS_CHECK_MAX_INTERVAL", str(30 * 60)))
+STATUS_CHECK_BACKOFF = float(os.environ.get("STATUS_CHECK_BACKOFF", "2"))
+STATUS_CHECK_JITTER = float(os.environ.get("STATUS_CHECK_JITTER", "0.1"))
+# The cache expires a little before the next check so each check fetches exactly once
+SUBMISSIONS_CACHE_RATIO = 0.9
+
+status_check_cadence = AdaptiveCadence(
+    min_interval=STATUS_CHECK_MIN_INTERVAL,
+    max_interval=STATUS_CHECK_MAX_INTERVAL,
+    backoff=STATUS_CHECK_BACKOFF,
+    jitter=STATUS_CHECK_JITTER
+)
+
+def create_submission_source(name, url, ttl=None):
+    """Cache, refresh lock and diff state for one submissions feed
+
+    A source with a ttl keeps that cache TTL; the others follow the status check cadence.
+    """
+    cache_seconds = ttl if ttl is not None else STATUS_CHECK_MIN_INTERVAL * SUBMISSIONS_CACHE_RATIO
+    return {
+        'name': name,
+        'url': url,
+        'ttl': ttl,
+        'cache': {
+            'data': None,
+            'last_updated': None,
+            'last_attempt': None,
+            'etag': None,
+            'last_modified': None,
+            'content_hash': None,
+            'cache_duration': timedelta(seconds=cache_seconds)
+        },
+        'lock': threading.Lock(),
+        'diff': {
+            'codes': None,
+            'tracked': set()
+        },
+        # Users subscribed to this source, kept in step with tracked_users under tracked_users_lock
+        'subscribers': set(),
+        'snapshot_file': None,
+        'shared_snapshot': None
+    }
+
+def parse_submission_sources(value):
+    sources = {}
+    for entry in filter(None, (entry.strip() for entry in value.split(','))):
+        name, separator, url = entry.partition('=')
+        url, _, ttl = url.partition('|')
+        name = name.strip()
+        if not separator or not name or not url.strip():
+            raise ValueError(f"Invalid SUBMISSION_SOURCES entry: {entry!r}")
+        if name in sources:
+            raise ValueError(f"Duplicate submission source: {name}")
+        sources[name] = create_submission_source(name, url.strip(), float(ttl) if ttl else None)
+    if not sources:
+        raise ValueError("SUBMISSION_SOURCES must name at least one source")
+    return sources
+
+submission_sources = parse_submission_sources(SUBMISSION_SOURCES)
+default_source = next(iter(submission_sources.values()))
+# The default source's state under the names the rest of the app has always used
+submissions_cache = default_source['cache']
+submissions_refresh_lock = default_source['lock']
+source_fetch_executor = ThreadPoolExecutor(max_workers=len(submission_sources), thread_name_prefix='source-fetch')
+
+def get_submission_source(name=None):
+    """Look up a source by name, or the default source; None for unknown names"""
+    if not name:
+        return default_source
+    return submission_sources.get(name)
+
+http_session = requests.Session()
+http_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+http_session.mount('https://', http_adapter)
+http_session.mount('http://', http_adapter)
+
+slack_profile_client = SessionSlackClient(http_session, SLACK_BOT_TOKEN, SLACK_API_URL, timeout=SLACK_PROFILE_TIMEOUT)
+slack_profiles = SlackProfileCache(
+    lambda method, **kwargs: slack_call(slack_profile_client, method, **kwargs),
+    max_size=SLACK_PROFILE_CACHE_SIZE,
+    ttl=SLACK_PROFILE_CACHE_TTL,
+    negative_ttl=SLACK_PROFILE_NEGATIVE_TTL
+)
+# Manual login looks profiles up once, with a short timeout and without waiting for the rate limiter
+slack_login_profile_client = SessionSlackClient(http_session, SLACK_BOT_TOKEN, SLACK_API_URL,
+                                                timeout=SLACK_PROFILE_LOGIN_TIMEOUT)
+
+def get_login_profile(slack_id):
+    """Profile for a manual login, never held up by Slack retries or rate limits
+
+    When the single lookup fails the placeholder name is used, and the
+    lookup is repeated with retries on the dispatcher's threads to fill the
+    cache for later logins.
+    """
+    profile = slack_profiles.get(slack_id, call=lambda method, **kwargs: slack_dispatcher.call(
+        slack_login_profile_client, method, max_retries=0, max_wait=0, **kwargs))
+    if profile is None and not slack_profiles.is_cached(slack_id):
+        slack_dispatcher.submit(slack_profiles.get, slack_id)
+    return profile or {'name': f'Slack User - {slack_id[:8]}', 'image': ''}
+
+bot_identity = {'user_id': None}
+
+status_diff_state = default_source['diff']
+
+# Stores, shared state files and the scheduler are opened by create_app()
+tracked_user_store = None
+notification_outbox = None
+scheduler_leader = None
+# Slack deliveries handled by any worker; only opened with several workers
+slack_delivery_log = None
+tracked_users = {}
+# Users changed in memory but not written to the store yet; reloading from the store must not overwrite them
+unsaved_user_ids = set()
+tracked_users_lock = threading.Lock()
+scheduler = BackgroundScheduler()
+startup_state = {'started': False}
+startup_lock = threading.Lock()
 
 def load_tracked_users():
+    return tracked_user_store.load()
+
+def save_tracked_user(user_id):
     try:
-        with open(TRACKED_USERS_FILE, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {}
+        tracked_user_store.save_user(user_id, tracked_users.get(user_id))
+    except Exception as e:
+        logger.error(f"Error saving tracked user {user_id}: {e}")
+        return
+    with tracked_users_lock:
+        unsaved_user_ids.discard(user_id)
 
-def save_tracked_users():
+def save_tracked_users(user_ids=None):
     try:
-        with open(TRACKED_USERS_FILE, 'w') as f:
-            json.dump(tracked_users, f, indent=2)
+        if user_ids is None:
+            tracked_user_store.save_all(tracked_users)
+        else:
+            with tracked_user_store.batch():
+                for user_id in user_ids:
+                    tracked_user_store.save_user(user_id, tracked_users.get(user_id))
     except Exception as e:
-        print(f"Error saving tracked users: {e}")
+        logger.error(f"Error saving tracked users: {e}")
+        return
+    with tracked_users_lock:
+        if user_ids is None:
+            unsaved_user_ids.clear()
+        else:
+            unsaved_user_ids.difference_update(user_ids)
 
-tracked_users = load_tracked_users()
-scheduler = BackgroundScheduler()
-scheduler.start()
+def get_snapshot_path(source):
+    """The default source keeps SUBMISSIONS_SNAPSHOT_FILE; others get a sibling file named after them"""
+    snapshot_path = app.config['SUBMISSIONS_SNAPSHOT_FILE']
+    if snapshot_path is None:
+        snapshot_path = os.path.join(app.config['SHARED_STATE_DIR'], 'submissions.snapshot')
+    if not snapshot_path or source is default_source:
+        return snapshot_path
+    root, extension = os.path.splitext(snapshot_path)
+    return f"{root}-{source['name']}{extension}"
+
+def open_state_files():
+    global tracked_user_store, notification_outbox, scheduler_leader, slack_delivery_log
+    multi_worker = app.config['WEB_WORKERS'] > 1
+    if multi_worker and app.config['TRACKED_USERS_STORE'] != 'sqlite':
+        raise ValueError("WEB_WORKERS > 1 requires TRACKED_USERS_STORE=sqlite")
+    
+    for source in submission_sources.values():
+        snapshot_path = get_snapshot_path(source)
+        # The last good snapshot is kept on disk so a restart can serve it before the first fetch
+        if snapshot_path:
+            source['snapshot_file'] = SharedSnapshotFile(snapshot_path, poll_interval=SHARED_SNAPSHOT_POLL_INTERVAL)
+        elif multi_worker:
+            raise ValueError("WEB_WORKERS > 1 requires SUBMISSIONS_SNAPSHOT_FILE")
+        if multi_worker:
+            source['shared_snapshot'] = source['snapshot_file']
+    if multi_worker:
+        scheduler_leader = LeaderLock(os.path.join(app.config['SHARED_STATE_DIR'], 'scheduler.lock'))
+        # A Slack retry may land on a different worker than the delivery it repeats
+        slack_delivery_log = SqliteDeliveryLog(os.path.join(app.config['SHARED_STATE_DIR'], 'slack_deliveries.db'),
+                                               ttl=SLACK_DEDUPE_TTL)
+    
+    tracked_users_db = app.config['TRACKED_USERS_DB']
+    tracked_user_store = create_tracked_user_store(app.config['TRACKED_USERS_STORE'], TRACKED_USERS_FILE, tracked_users_db)
+    outbox_path = (app.config['NOTIFICATION_OUTBOX_DB'] or
+                   os.path.join(os.path.dirname(tracked_users_db), 'notification_outbox.db'))
+    notification_outbox = SqliteNotificationOutbox(outbox_path, default_source['name'],
+                                                   max_attempts=NOTIFICATION_MAX_ATTEMPTS,
+                                                   retry_base=NOTIFICATION_RETRY_BASE)
+
+def sync_tracked_users():
+    """Pick up tracked users changed by other worker processes, keeping changes this one has not saved yet
+
+    Reloaded users are merged into the existing dicts, so code holding one of them keeps seeing current data.
+    """
+    if app.config['WEB_WORKERS'] == 1 or not tracked_user_store.has_external_changes():
+        return
+    users = tracked_user_store.load()
+    with tracked_users_lock:
+        changed = tracked_users.keys() - users.keys() - unsaved_user_ids
+        for user_id in changed:
+            tracked_users.pop(user_id, None)
+        for user_id, user_data in users.items():
+            current = tracked_users.get(user_id)
+            if user_id in unsaved_user_ids or current == user_data:
+                continue
+            if current is None:
+                tracked_users[user_id] = user_data
+            else:
+                current.clear()
+                current.update(user_data)
+            changed.add(user_id)
+        index_subscriptions(changed)
+
+def run_as_leader(job):
+    if scheduler_leader is None or scheduler_leader.is_leader():
+        job()
+
+def is_submissions_cache_fresh(source=default_source):
+    cache = source['cache']
+    last_updated = cache['last_updated']
+    return (cache['data'] is not None and
+            last_updated is not None and
+            datetime.now() - last_updated <= cache['cache_duration'])
+
+def fetch_submissions(source=default_source):
+    """Fetch a submissions feed into its cache; the caller must hold the source's lock"""
+    shared_snapshot = source['shared_snapshot']
+    if shared_snapshot is None:
+        previous_meta = get_snapshot_meta(source)
+        fetched = fetch_submissions_from_upstream(source)
+        if fetched and source['snapshot_file'] is not None:
+            save_snapshot_file(source, revalidated=get_snapshot_meta(source) == previous_meta)
+        return fetched
+    
+    with shared_snapshot.lock():
+        adopt_shared_snapshot(shared_snapshot.read(source['cache']['content_hash']), source)
+        if is_submissions_cache_fresh(source):
+            return True
+        previous_meta = get_snapshot_meta(source)
+        fetched = fetch_submissions_from_upstream(source)
+        if fetched:
+            publish_shared_snapshot(source, revalidated=get_snapshot_meta(source) == previous_meta)
+        return fetched
+
+def adopt_shared_snapshot(shared, source=default_source):
+    """Use a snapshot published by another worker, or saved by a previous run, if it is newer than ours"""
+    if shared is None:
+        return False
+    cache = source['cache']
+    published_at = datetime.fromtimestamp(shared['published_at'])
+    if cache['last_updated'] is not None and published_at <= cache['last_updated']:
+        if published_at == cache['last_updated'] and source['ttl'] is None:
+            # The leader republished the snapshot we hold with the TTL of its next check
+            cache['cache_duration'] = timedelta(seconds=shared['cache_seconds'])
+        return False
+    meta = shared['meta']
+    if shared['codes'] is not None:
+        known_statuses = len(status_values)
+        previous_snapshot = cache['data']
+        cache['data'] = import_snapshot(shared['slack_ids'], shared['statuses'],
+                                        shared['codes'], shared['submission_count'])
+        cache['data'].version = meta['content_hash'][:16]
+        cache['data'].created_at = datetime.fromtimestamp(shared['published_at'], timezone.utc)
+        stream_status_changes(previous_snapshot, cache['data'], source)
+        if len(status_values) != known_statuses:
+            warm_ai_message_pool([status for status in status_values if isinstance(status, str)])
+    cache['etag'] = meta['etag']
+    cache['last_modified'] = meta['last_modified']
+    cache['content_hash'] = meta['content_hash']
+    cache['last_updated'] = published_at
+    if source['ttl'] is None:
+        cache['cache_duration'] = timedelta(seconds=shared['cache_seconds'])
+    logger.debug(f"Adopted shared {source['name']} snapshot version {shared['version']}")
+    return True
+
+def get_snapshot_meta(source):
+    cache = source['cache']
+    return {
+        'etag': cache['etag'],
+        'last_modified': cache['last_modified'],
+        'content_hash': cache['content_hash']
+    }
+
+def save_snapshot_file(source=default_source, revalidated=False):
+    snapshot_file = source['snapshot_file']
+    try:
+        with snapshot_file.lock():
+            publish_shared_snapshot(source, revalidated)
+    except OSError as e:
+        logger.warning(f"Could not save submissions snapshot to {snapshot_file.path}: {e}")
+
+def publish_shared_snapshot(source=default_source, revalidated=False):
+    """Write the cached snapshot to the source's file; a revalidation of unchanged content only touches its header"""
+    cache = source['cache']
+    snapshot_file = source['snapshot_file']
+    published_at = cache['last_updated'].timestamp()
+    cache_seconds = cache['cache_duration'].total_seconds()
+    meta = get_snapshot_meta(source)
+    if revalidated and snapshot_file.refresh(published_at, cache_seconds, meta):
+        return
+    snapshot = cache['data']
+    slack_ids, statuses = export_tables(len(snapshot.codes))
+    snapshot_file.publish(snapshot.codes, slack_ids, statuses, snapshot.submission_count,
+                          published_at=published_at, cache_seconds=cache_seconds, meta=meta)
 
-atexit.register(save_tracked_users)
+def publish_cache_duration(source):
+    """Hand the TTL of the next check to the other workers without changing the snapshot they hold"""
+    if source['shared_snapshot'] is None or source['cache']['data'] is None:
+        return
+    cache = source['cache']
+    try:
+        with source['lock'], source['shared_snapshot'].lock():
+            source['shared_snapshot'].refresh(cache['last_updated'].timestamp(), cache['cache_duration'].total_seconds(),
+                                              get_snapshot_meta(source))
+    except OSError as e:
+        logger.warning(f"Could not publish the {source['name']} cache TTL: {e}")
+
+def sync_shared_snapshot(source=default_source):
+    if not source['lock'].acquire(blocking=False):
+        return
+    try:
+        adopt_shared_snapshot(source['shared_snapshot'].poll(source['cache']['content_hash']), source)
+    finally:
+        source['lock'].release()
 
-def get_cached_submissions():
-    now = datetime.now()
-    if (submissions_cache['data'] is None or 
-        submissions_cache['last_updated'] is None or 
-        now - submissions_cache['last_updated'] > submissions_cache['cache_duration']):
+def fetch_submissions_from_upstream(source=default_source):
+    name = source['name']
+    cache = source['cache']
+    cache['last_attempt'] = time.monotonic()
+    started = time.perf_counter()
+    try:
+        logger.debug(f"Fetching fresh {name} data from API...")
+        headers = {}
+        if cache['data'] is not None:
+            if cache['etag']:
+                headers['If-None-Match'] = cache['etag']
+            if cache['last_modified']:
+                headers['If-Modified-Since'] = cache['last_modified']
         
-        try:
-            print("Fetching fresh data from API...")
-            response = requests.get('https://adventure-time.hackclub.dev/api/getYSWSSubmissions')
+        with http_session.get(source['url'], headers=headers, timeout=SUBMISSIONS_FETCH_TIMEOUT, stream=True) as response:
+            now = datetime.now()
+            if response.status_code == 304:
+                cache['last_updated'] = now
+                submissions_fetches.inc(name, 'not_modified')
+                logger.debug(f"{name} submissions not modified, cache revalidated at {now}")
+                return True
             response.raise_for_status()
             
-            submissions_cache['data'] = response.json()
-            submissions_cache['last_updated'] = now
-            print(f"Cache updated at {now}")
+            content_hash = hashlib.sha256()
+            
+            def hashed_chunks():
+                for chunk in response.iter_content(chunk_size=SUBMISSIONS_CHUNK_SIZE):
+                    content_hash.update(chunk)
+                    yield chunk
             
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching submissions: {e}")
-            if submissions_cache['data'] is None:
-                return None
+            known_statuses = len(status_values)
+            snapshot = build_snapshot(iter_submissions(hashed_chunks()))
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+        
+        cache['etag'] = etag
+        cache['last_modified'] = last_modified
+        content_hash = content_hash.hexdigest()
+        if cache['data'] is not None and content_hash == cache['content_hash']:
+            cache['last_updated'] = now
+            submissions_fetches.inc(name, 'unchanged')
+            logger.debug(f"{name} submissions unchanged, cache revalidated at {now}")
+            return True
+        
+        if len(status_values) != known_statuses:
+            warm_ai_message_pool([status for status in status_values if isinstance(status, str)])
+        snapshot.version = content_hash[:16]
+        snapshot.created_at = datetime.now(timezone.utc)
+        previous_snapshot = cache['data']
+        cache['data'] = snapshot
+        cache['content_hash'] = content_hash
+        stream_status_changes(previous_snapshot, snapshot, source)
+        cache['last_updated'] = now
+        submissions_fetches.inc(name, 'updated')
+        logger.info(f"{name} cache updated at {now}: {snapshot.submission_count} submissions, "
+                    f"{snapshot.get_nbytes()} bytes of status codes")
+        return True
+        
+    except (requests.exceptions.RequestException, ValueError) as e:
+        submissions_fetches.inc(name, 'error')
+        logger.error(f"Error fetching {name} submissions: {e}")
+        return False
+    finally:
+        submissions_fetch_seconds.observe(time.perf_counter() - started, name)
+
+def refresh_submissions_in_background(source=default_source):
+    if not source['lock'].acquire(blocking=False):
+        return False
+    
+    def run():
+        try:
+            fetch_submissions(source)
+        finally:
+            source['lock'].release()
+    
+    threading.Thread(target=run, name=f"submissions-refresh-{source['name']}", daemon=True).start()
+    return True
+
+def refresh_submissions_ahead():
+    # Sources with their own TTL are refreshed when a lookup finds them expired
+    for source in submission_sources.values():
+        if source['ttl'] is not None or not source['lock'].acquire(blocking=False):
+            continue
+        try:
+            fetch_submissions(source)
+        finally:
+            source['lock'].release()
+
+def get_cached_submissions(allow_stale=True, source=default_source):
+    name = source['name']
+    cache = source['cache']
+    if source['shared_snapshot'] is not None:
+        sync_shared_snapshot(source)
+    
+    if is_submissions_cache_fresh(source):
+        submissions_cache_lookups.inc(name, 'fresh')
+        logger.debug("Using cached data")
+        return cache['data']
+    
+    if cache['data'] is not None and allow_stale:
+        refresh_submissions_in_background(source)
+        if has_request_context():
+            g.snapshot_age = get_snapshot_age(source)
+        submissions_cache_lookups.inc(name, 'stale')
+        logger.debug("Using stale cached data while refreshing")
+        return cache['data']
+    
+    submissions_cache_lookups.inc(name, 'miss')
+    waited_since = time.monotonic()
+    with source['lock']:
+        last_attempt = cache['last_attempt']
+        if not is_submissions_cache_fresh(source) and (last_attempt is None or last_attempt < waited_since):
+            fetch_submissions(source)
+    
+    return cache['data']
+
+def sync_streamed_snapshots():
+    """Adopt snapshots other workers published, so streams open on this worker see changes it did not fetch"""
+    for source in submission_sources.values():
+        if source['shared_snapshot'] is None:
+            continue
+        try:
+            sync_shared_snapshot(source)
+        except Exception as e:
+            logger.warning(f"Could not sync the shared {source['name']} snapshot for event streams: {e}")
+
+status_stream_hub = StatusStreamHub(max_streams=SSE_MAX_STREAMS, heartbeat=SSE_HEARTBEAT, max_duration=SSE_MAX_DURATION,
+                                    watch=sync_streamed_snapshots, watch_interval=SHARED_SNAPSHOT_POLL_INTERVAL)
+
+def get_status_event(status):
+    if not status:
+        return {'status': None}
+    emoji, status_name, description = get_status_emoji_and_description(status)
+    return {'status': status, 'emoji': emoji, 'name': status_name, 'description': description}
+
+def stream_status_changes(previous_snapshot, snapshot, source=default_source):
+    """Push the new status to every open dashboard stream on source whose user's status changed"""
+    if previous_snapshot is None:
+        return
+    for key in status_stream_hub.get_keys():
+        user_id, name = key
+        if name != source['name']:
+            continue
+        status = snapshot.get_status(user_id)
+        if previous_snapshot.get_status(user_id) != status:
+            status_stream_hub.publish(key, get_status_event(status))
+
+def get_changed_slots(source, new_codes):
+    """Slots whose status code differs from source's previous check, or None on its first check"""
+    previous_codes = source['diff']['codes']
+    if previous_codes is None:
+        return None
+    if new_codes is previous_codes:
+        return []
+    return diff_status_codes(previous_codes, new_codes)
+
+def get_status_changes(new_codes, changed_slots, subscribers, source=default_source):
+    """Return (user_id, old_status, new_status) for subscribers whose status in source changed since its last check"""
+    diff_state = source['diff']
+    if changed_slots is None:
+        candidates = set(subscribers)
     else:
-        print("Using cached data")
+        candidates = {slot_slack_ids[slot] for slot in changed_slots}
+        candidates |= subscribers - diff_state['tracked']
     
-    return submissions_cache['data']
+    status_check_users_checked.set(len(candidates), source['name'])
+    changes = []
+    for user_id in candidates:
+        user_data = tracked_users.get(user_id)
+        state = get_source_state(user_data, source) if user_data is not None else None
+        slot = slack_id_slots.get(user_id)
+        if state is None or slot is None or slot >= len(new_codes):
+            continue
+        code = new_codes[slot]
+        if code == STATUS_MISSING:
+            continue
+        new_status = status_values[code]
+        if new_status != state['last_status']:
+            changes.append((user_id, state['last_status'], new_status))
+    return changes
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+    sync_tracked_users()
+
+@app.after_request
+def record_request_latency(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        http_request_seconds.observe(time.perf_counter() - started, route, request.method, str(response.status_code))
+    return response
+
+@app.after_request
+def compress_response(response):
+    if (response.status_code != 200 or response.is_streamed or response.direct_passthrough
+            or 'Content-Encoding' in response.headers or response.mimetype not in GZIP_MIMETYPES):
+        return response
+    response.vary.add('Accept-Encoding')
+    if 'gzip' not in request.headers.get('Accept-Encoding', ''):
+        return response
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+    response.set_data(gzip.compress(data, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+def get_snapshot_age(source=default_source):
+    """Seconds since the cached snapshot was last fetched or revalidated"""
+    last_updated = source['cache']['last_updated']
+    if last_updated is None:
+        return None
+    return max(0, int((datetime.now() - last_updated).total_seconds()))
+
+@app.after_request
+def mark_stale_response(response):
+    snapshot_age = g.pop('snapshot_age', None)
+    if snapshot_age is not None:
+        response.headers['X-Snapshot-Age'] = str(snapshot_age)
+    return response
+
+def get_cache_max_age(source=default_source):
+    """Seconds until a submissions cache expires, which bounds how long a response stays current"""
+    cache = source['cache']
+    last_updated = cache['last_updated']
+    if last_updated is None:
+        return 0
+    remaining = cache['cache_duration'] - (datetime.now() - last_updated)
+    return max(0, int(remaining.total_seconds()))
+
+def get_response_etag(*parts):
+    return hashlib.blake2b('\x1f'.join(map(str, parts)).encode(), digest_size=12).hexdigest()
+
+def conditional_response(etag, snapshot, render, private=False, source=default_source):
+    """Answer 304 when the client already holds this representation, otherwise render it; both carry caching headers"""
+    last_modified = None if private else snapshot.created_at
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains_weak(etag)
+    else:
+        not_modified = (last_modified is not None and request.if_modified_since is not None and
+                        last_modified.replace(microsecond=0) <= request.if_modified_since)
+    response = Response(status=304) if not_modified else make_response(render())
+    response.set_etag(etag, weak=True)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.cache_control.max_age = get_cache_max_age(source)
+    if private:
+        response.cache_control.private = True
+        response.vary.add('Cookie')
+    else:
+        response.cache_control.public = True
+    return response
+
+def parse_rate_limits(value):
+    if value.strip().lower() == 'off':
+        return {}
+    limits = dict(DEFAULT_RATE_LIMITS)
+    for entry in filter(None, (entry.strip() for entry in value.split(','))):
+        route, separator, budget = entry.partition('=')
+        route = route.strip()
+        if not separator or route not in DEFAULT_RATE_LIMITS:
+            raise ValueError(f"Invalid RATE_LIMITS entry: {entry!r}")
+        requests_count, _, seconds = budget.partition('/')
+        if int(requests_count) <= 0:
+            limits.pop(route)
+        else:
+            limits[route] = (int(requests_count), float(seconds or 60))
+    return limits
+
+rate_limits = parse_rate_limits(RATE_LIMITS)
+rate_limiter = RateLimiter(max_buckets=RATE_LIMIT_MAX_BUCKETS)
+
+def rate_limited(route):
+    """Answer 429 with Retry-After once a client's IP or session has spent the route's budget"""
+    def decorator(view):
+        @functools.wraps(view)
+        def limited_view(*args, **kwargs):
+            budget = rate_limits.get(route)
+            if budget is None:
+                return view(*args, **kwargs)
+            requests_count, seconds = budget
+            keys = [(route, 'ip', request.remote_addr)]
+            # Only read the session when a cookie was sent, so cookieless API responses do not vary on Cookie
+            if app.config['SESSION_COOKIE_NAME'] in request.cookies and 'user_id' in session:
+                keys.append((route, 'session', session['user_id']))
+            limited_key, retry_after = rate_limiter.acquire(keys, requests_count / seconds, requests_count)
+            if limited_key is None:
+                rate_limit_requests.inc(route, 'allowed')
+                return view(*args, **kwargs)
+            rate_limit_requests.inc(route, f'{limited_key[1]}_limited')
+            return jsonify({'error': 'Too many requests'}), 429, {'Retry-After': str(max(1, math.ceil(retry_after)))}
+        return limited_view
+    return decorator
+
+@app.route('/metrics')
+def metrics_endpoint():
+    return Response(metrics_registry.render(), mimetype='text/plain; version=0.0.4')
+
+def get_requested_source():
+    """The source named by ?source=, or the default source; None for unknown names"""
+    return get_submission_source(request.args.get('source'))
 
 @app.route('/status/<slack_real_id>', methods=['GET'])
+@rate_limited('status')
 def get_status(slack_real_id):
+    source = get_requested_source()
+    if source is None:
+        return jsonify({'error': 'Unknown submission source'}), 404
     try:
-        data = get_cached_submissions()
-        if data is None:
+        snapshot = get_cached_submissions(source=source)
+        if snapshot is None:
             return jsonify({'error': 'Failed to fetch submissions'}), 500
-            
-        submissions = data.get('submissions', [])
         
-        for submission in submissions:
-            if submission.get('slackRealId') and slack_real_id in submission['slackRealId']:
-                status = submission.get('status', 'Unknown')
+        status = snapshot.get_status(slack_real_id)
+        if status:
+            def render():
                 emoji, status_name, description = get_status_emoji_and_description(status)
                 return jsonify({
                     'status': status_name,
@@ -115,12 +879,49 @@ def get_status(slack_real_id):
                     'status_name': status_name,
                     'description': description
                 })
+            return conditional_response(get_response_etag(snapshot.version, status), snapshot, render, source=source)
         
         return jsonify({'error': 'User not found'}), 404
         
     except Exception as e:
         return jsonify({'error': 'Failed to fetch submissions'}), 500
 
+def get_status_result(snapshot, slack_id):
+    status = snapshot.get_status(slack_id)
+    if not status:
+        return {'slack_id': slack_id, 'error': 'User not found'}
+    emoji, status_name, description = get_status_emoji_and_description(status)
+    return {
+        'slack_id': slack_id,
+        'status': status_name,
+        'emoji': emoji,
+        'status_name': status_name,
+        'description': description
+    }
+
+@app.route('/status/batch', methods=['POST'])
+@rate_limited('status_batch')
+def get_status_batch():
+    """Resolve many Slack IDs against one snapshot; ?format=ndjson streams one result per line"""
+    source = get_requested_source()
+    if source is None:
+        return jsonify({'error': 'Unknown submission source'}), 404
+    body = request.get_json(silent=True)
+    slack_ids = body.get('slack_ids') if isinstance(body, dict) else body
+    if not isinstance(slack_ids, list) or not all(isinstance(slack_id, str) for slack_id in slack_ids):
+        return jsonify({'error': 'Expected a JSON list of Slack IDs or {"slack_ids": [...]}'}), 400
+    if len(slack_ids) > STATUS_BATCH_MAX:
+        return jsonify({'error': f'At most {STATUS_BATCH_MAX} Slack IDs per batch'}), 413
+    
+    snapshot = get_cached_submissions(source=source)
+    if snapshot is None:
+        return jsonify({'error': 'Failed to fetch submissions'}), 500
+    
+    if request.args.get('format') == 'ndjson' or 'application/x-ndjson' in request.headers.get('Accept', ''):
+        lines = (json.dumps(get_status_result(snapshot, slack_id)) + '\n' for slack_id in slack_ids)
+        return Response(lines, mimetype='application/x-ndjson')
+    return jsonify({'results': [get_status_result(snapshot, slack_id) for slack_id in slack_ids]})
+
 def get_status_emoji_and_description(status):
     if status.startswith("1–"):
         return "🕛", "Pending Submission", "Your submission is waiting to be reviewed"
@@ -131,7 +932,7 @@ def get_status_emoji_and_description(status):
     else:
         return "⚪", "Unknown", "Status is not recognized"
 
-def get_ai_message(status_name, old_status=None):
+def generate_ai_message(status_name, old_status=None):
     try:
         if status_name == "Pending Submission":
             if old_status:
@@ -151,8 +952,9 @@ def get_ai_message(status_name, old_status=None):
         else:
             prompt = f"Something went wrong with the status update. Please check the status name: {status_name}. Write a short casual buddy message about a YSWS submission status update. Keep it simple and friend-like. It has been '{old_status}' before."
 
-        response = requests.post(
-            'https://ai.hackclub.com/chat/completions',
+        started = time.perf_counter()
+        response = http_session.post(
+            AI_COMPLETIONS_URL,
             headers={'Content-Type': 'application/json'},
             json={
                 'messages': [
@@ -162,15 +964,86 @@ def get_ai_message(status_name, old_status=None):
             },
             timeout=10
         )
+        ai_request_seconds.observe(time.perf_counter() - started)
         
         if response.status_code == 200:
             ai_data = response.json()
             if 'choices' in ai_data and len(ai_data['choices']) > 0:
+                ai_requests.inc('ok')
                 return ai_data['choices'][0]['message']['content'].strip()
     
     except Exception as e:
-        print(f"Error getting AI message: {e}")
+        logger.warning(f"Error getting AI message: {e}")
     
+    ai_requests.inc('error')
+    return None
+
+ai_message_pool = MessagePool(
+    generate_ai_message,
+    variants=AI_MESSAGE_VARIANTS,
+    ttl=AI_MESSAGE_TTL,
+    max_keys=AI_MESSAGE_POOL_SIZE
+)
+
+@metrics_registry.collector
+def collect_background_metrics():
+    pool_stats = ai_message_pool.get_stats()
+    pool_lookups = Counter('ai_message_pool_lookups_total', "AI message pool lookups by result", ['result'])
+    pool_lookups.inc('hit', amount=pool_stats['hits'])
+    pool_lookups.inc('miss', amount=pool_stats['misses'])
+    pool_refills = Counter('ai_message_pool_refills_total', "AI message pool refill attempts by outcome", ['outcome'])
+    pool_refills.inc('ok', amount=pool_stats['refills'])
+    pool_refills.inc('error', amount=pool_stats['refill_failures'])
+    slack_retries = Counter('slack_api_retries_total', "Retried Slack Web API call attempts by method", ['method'])
+    for method, method_stats in slack_dispatcher.get_stats().items():
+        slack_retries.inc(method, amount=method_stats['retries'])
+    listener_stats = slack_listener_executor.get_stats()
+    listener_queue = Gauge('slack_listener_queue_depth', "Slack listener work waiting for a worker")
+    listener_queue.set(listener_stats['queued'])
+    listener_running = Gauge('slack_listener_running', "Slack listener work currently running")
+    listener_running.set(listener_stats['running'])
+    listener_rejected = Counter('slack_listener_rejected_total', "Slack listener work dropped because the queue was full")
+    listener_rejected.inc(amount=listener_stats['rejected'])
+    stream_stats = status_stream_hub.get_stats()
+    open_streams = Gauge('sse_streams_open', "Open dashboard event streams")
+    open_streams.set(stream_stats['streams'])
+    rejected_streams = Counter('sse_streams_rejected_total', "Dashboard event streams refused at the stream limit")
+    rejected_streams.inc(amount=stream_stats['rejected'])
+    stream_events = Counter('sse_events_total', "Status events pushed to dashboard streams")
+    stream_events.inc(amount=stream_stats['events'])
+    profile_stats = slack_profiles.get_stats()
+    profile_lookups = Counter('slack_profile_lookups_total', "Slack profile cache lookups by result", ['result'])
+    for result in ('hit', 'negative_hit', 'miss', 'error'):
+        profile_lookups.inc(result, amount=profile_stats[result])
+    profiles_cached = Gauge('slack_profiles_cached', "Slack profiles held in the cache, including unknown IDs")
+    profiles_cached.set(profile_stats['size'])
+    outbox_stats = notification_outbox.get_stats()
+    outbox_pending = Gauge('notification_outbox_pending', "Notifications waiting in the outbox for delivery")
+    outbox_pending.set(outbox_stats['pending'])
+    outbox_parked = Gauge('notification_outbox_parked', "Notifications parked after running out of attempts")
+    outbox_parked.set(outbox_stats['parked'])
+    outbox_oldest = Gauge('notification_outbox_oldest_seconds', "Age of the oldest notification waiting in the outbox")
+    outbox_oldest.set(outbox_stats['oldest_age'])
+    limiter_stats = rate_limiter.get_stats()
+    limiter_buckets = Gauge('rate_limit_buckets', "Client token buckets held by the rate limiter")
+    limiter_buckets.set(limiter_stats['buckets'])
+    limiter_evictions = Counter('rate_limit_bucket_evictions_total', "Least recently used client buckets evicted at the size limit")
+    limiter_evictions.inc(amount=limiter_stats['evictions'])
+    return [pool_lookups, pool_refills, slack_retries, listener_queue, listener_running, listener_rejected,
+            open_streams, rejected_streams, stream_events, profile_lookups, profiles_cached,
+            outbox_pending, outbox_parked, outbox_oldest, limiter_buckets, limiter_evictions]
+
+def warm_ai_message_pool(statuses):
+    ai_message_pool.warm([(get_status_emoji_and_description(status)[1], old_status)
+                          for old_status in statuses for status in statuses if status != old_status])
+
+def get_ai_message(status_name, old_status=None):
+    ai_message = ai_message_pool.get((status_name, old_status))
+    if ai_message:
+        ai_messages.inc('pool')
+        return ai_message
+    
+    ai_messages.inc('fallback')
     fallback_messages = {
         "Pending Submission": "⏳ Still waiting on the review team, huh? They're probably just taking their time to appreciate your work �",
         "Approved": "🎉 Yooo, you got approved! Nice work buddy! 🚀",
@@ -179,61 +1052,324 @@ def get_ai_message(status_name, old_status=None):
     
     return fallback_messages.get(status_name, "📱 Got an update on your submission! Let's see what's up 👀")
 
-def get_user_submission_status(slack_real_id):
+def get_user_submission_status(slack_real_id, source=default_source):
     try:
-        data = get_cached_submissions()
-        if data is None:
+        snapshot = get_cached_submissions(source=source)
+        if snapshot is None:
             return None
-            
-        submissions = data.get('submissions', [])
-        
-        for submission in submissions:
-            if submission.get('slackRealId') and slack_real_id in submission['slackRealId']:
-                return submission.get('status', 'Unknown')
-        
-        return None
+        return snapshot.get_status(slack_real_id)
     except Exception:
         return None
 
+def get_source_label(source):
+    return "YSWS" if source is default_source else f"YSWS ({source['name']})"
+
+def notify_status_change(user_id, old_status, current_status, ai_message, source=default_source):
+    emoji, status_name, description = get_status_emoji_and_description(current_status)
+    send_dm(get_slack_client(), user_id,
+        text=f"{ai_message}\n\n"
+            f"🔄 *Status Update Alert*\n\n"
+            f"Your {get_source_label(source)} submission status has changed!\n"
+            f"*Current Status:* {emoji} {status_name}\n\n"
+            f"💬 *Description:* {description}\n\n"
+            f"*Last Updated:* {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}"
+    )
+    mark_status_notified(user_id, current_status, source)
+    logger.info(f"{source['name']} status updated for user {user_id}: {old_status} -> {current_status}")
+
+def get_source_state(user_data, source):
+    """A tracked user's {'last_status', 'last_updated'} in source, or None if they are not subscribed to it
+
+    The default source's state is kept at the top level of the tracked user
+    record, other subscriptions live under 'sources'. Each is optional, so a
+    user may follow any mix of sources.
+    """
+    if source is default_source:
+        return user_data if 'last_status' in user_data else None
+    return (user_data.get('sources') or {}).get(source['name'])
+
+def index_subscriptions(user_ids=None):
+    """Update the sources' subscriber sets for user_ids after their records changed, or rebuild them for everyone
+
+    The caller holds tracked_users_lock.
+    """
+    if user_ids is None:
+        for source in submission_sources.values():
+            source['subscribers'].clear()
+        user_ids = tracked_users.keys()
+    for user_id in user_ids:
+        user_data = tracked_users.get(user_id)
+        for source in submission_sources.values():
+            if user_data is not None and get_source_state(user_data, source) is not None:
+                source['subscribers'].add(user_id)
+            else:
+                source['subscribers'].discard(user_id)
+
+def get_subscribers(source):
+    """A copy of source's subscribers, safe to keep while tracking changes"""
+    with tracked_users_lock:
+        return set(source['subscribers'])
+
+def get_subscriptions(user_id):
+    """The sources a user is subscribed to, as (source, state) pairs in SUBMISSION_SOURCES order"""
+    user_data = tracked_users.get(user_id)
+    if user_data is None:
+        return []
+    subscriptions = []
+    for source in submission_sources.values():
+        state = get_source_state(user_data, source)
+        if state is not None:
+            subscriptions.append((source, state))
+    return subscriptions
+
+def is_tracking(user_id, source=default_source):
+    user_data = tracked_users.get(user_id)
+    return user_data is not None and get_source_state(user_data, source) is not None
+
+def start_tracking(user_id, channel, status, source=default_source):
+    """Subscribe a user to source, keeping their subscriptions to the other sources"""
+    state = {'last_status': status, 'last_updated': datetime.now().isoformat()}
+    with tracked_users_lock:
+        user_data = tracked_users.setdefault(user_id, {})
+        user_data['channel'] = channel
+        if source is default_source:
+            user_data.update(state)
+        else:
+            user_data.setdefault('sources', {})[source['name']] = state
+        source['subscribers'].add(user_id)
+        unsaved_user_ids.add(user_id)
+    save_tracked_user(user_id)
+
+def stop_tracking(user_id, source=None):
+    """Unsubscribe a user from source, or from every source; returns False if there was nothing to stop
+
+    A user left without any subscription is removed.
+    """
+    with tracked_users_lock:
+        user_data = tracked_users.get(user_id)
+        if user_data is None:
+            return False
+        if source is None:
+            del tracked_users[user_id]
+        else:
+            if get_source_state(user_data, source) is None:
+                return False
+            if source is default_source:
+                del user_data['last_status']
+                user_data.pop('last_updated', None)
+            else:
+                del user_data['sources'][source['name']]
+                if not user_data['sources']:
+                    del user_data['sources']
+            if 'last_status' not in user_data and 'sources' not in user_data:
+                del tracked_users[user_id]
+        index_subscriptions([user_id])
+        unsaved_user_ids.add(user_id)
+    save_tracked_user(user_id)
+    return True
+
+def mark_status_notified(user_id, status, source=default_source):
+    """Record the status a user was told about; the caller saves the user afterwards"""
+    with tracked_users_lock:
+        state = get_source_state(tracked_users[user_id], source)
+        if state is None:
+            return
+        unsaved_user_ids.add(user_id)
+        state['last_status'] = status
+        state['last_updated'] = datetime.now().isoformat()
+
+def deliver_notification(notification):
+    """Send one outbox notification; returns True if the user was messaged"""
+    user_id = notification['user_id']
+    source = submission_sources.get(notification['source'])
+    user_data = tracked_users.get(user_id)
+    state = get_source_state(user_data, source) if user_data is not None and source is not None else None
+    if state is None:
+        notification_outbox.discard(notification)
+        notifications.inc('discarded')
+        return False
+    current_status = get_user_submission_status(user_id, source) or notification['new_status']
+    if current_status == state['last_status']:
+        notification_outbox.discard(notification)
+        notifications.inc('discarded')
+        return False
+    if current_status != notification['new_status']:
+        # The status moved on since detection; send one message for the newest status instead
+        notification_outbox.enqueue(user_id, source['name'], state['last_status'], current_status)
+        notifications.inc('coalesced')
+        return False
+    
+    try:
+        ai_message = notification['message']
+        if ai_message is None:
+            status_name = get_status_emoji_and_description(current_status)[1]
+            ai_message = get_ai_message(status_name, notification['old_status'])
+            notification_outbox.set_message(notification, ai_message)
+        notify_status_change(user_id, notification['old_status'], current_status, ai_message, source)
+    except Exception as e:
+        if notification_outbox.retry(notification, e):
+            notifications.inc('retried')
+            logger.warning(f"Error sending message to {user_id}, will retry: {e}")
+        else:
+            notifications.inc('parked')
+            logger.error(f"Giving up on message to {user_id} after {notification['attempts'] + 1} attempts: {e}")
+        return False
+    notification_outbox.complete(notification)
+    notifications.inc('delivered')
+    return True
+
+def deliver_notifications():
+    """Drain due notifications from the outbox, one batch at a time"""
+    while True:
+        batch = notification_outbox.get_due(NOTIFICATION_BATCH_SIZE)
+        if not batch:
+            return
+        with notification_batch_seconds.time():
+            futures = [slack_dispatcher.submit(deliver_notification, notification) for notification in batch]
+            wait(futures)
+        notified_users = list(dict.fromkeys(notification['user_id'] for notification, future in zip(batch, futures)
+                                            if future.exception() is None and future.result()))
+        if notified_users:
+            save_tracked_users(notified_users)
+            refresh_home_tabs(notified_users)
+            ai_stats = ai_message_pool.get_stats()
+            logger.info(f"Delivered {len(notified_users)} notification(s), AI message pool hit rate "
+                        f"{ai_stats['hit_rate']:.0%}, average refill {ai_stats['avg_refill_time']:.2f}s")
+        if len(batch) < NOTIFICATION_BATCH_SIZE:
+            return
+
+def enqueue_status_changes(changes, source=default_source):
+    already_delivered = []
+    for user_id, old_status, current_status in changes:
+        if notification_outbox.enqueue(user_id, source['name'], old_status, current_status):
+            notifications.inc('enqueued')
+        else:
+            notifications.inc('already_delivered')
+            mark_status_notified(user_id, current_status, source)
+            already_delivered.append(user_id)
+    if already_delivered:
+        save_tracked_users(already_delivered)
+        refresh_home_tabs(already_delivered)
+
 def check_status_changes():
-    print(f"Checking status changes for {len(tracked_users)} users...")
+    """Run one status check; returns True if any status changed since the previous check"""
+    with status_check_seconds.time():
+        return run_status_check()
+
+def run_status_check():
+    sync_tracked_users()
+    logger.debug(f"Checking status changes for {len(tracked_users)} users in {len(submission_sources)} source(s)...")
+    # Every source is fetched at once, so a cycle takes as long as the slowest source rather than their sum
+    fetches = [(source, source_fetch_executor.submit(get_cached_submissions, False, source))
+               for source in submission_sources.values()]
     
-    for user_id, user_data in list(tracked_users.items()):
-        current_status = get_user_submission_status(user_id)
-        
-        if current_status is None:
-            print(f"Could not fetch status for user {user_id}")
+    checked = 0
+    snapshot_changed = False
+    for source, fetch in fetches:
+        if fetch.result() is None or not is_submissions_cache_fresh(source):
+            # A snapshot loaded from disk may be older than the statuses users were last told about
+            logger.warning(f"Skipping {source['name']} status check, fresh submissions are unavailable")
             continue
-            
-        if current_status != user_data['last_status']:
-            try:
-                emoji, status_name, description = get_status_emoji_and_description(current_status)
-                old_emoji, old_status_name, _ = get_status_emoji_and_description(user_data['last_status'])
-                ai_message = get_ai_message(status_name, user_data['last_status'])
-
-                delete_bot_messages_in_dm(slack_app.client, user_id)
-                
-                slack_app.client.chat_postMessage(
-                    channel=user_id,
-                    text=f"{ai_message}\n\n"
-                        f"🔄 *Status Update Alert*\n\n"
-                        f"Your YSWS submission status has changed!\n"
-                        f"*Current Status:* {emoji} {status_name}\n\n"
-                        f"💬 *Description:* {description}\n\n"
-                        f"*Last Updated:* {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}"
-                )
-                tracked_users[user_id]['last_status'] = current_status
-                tracked_users[user_id]['last_updated'] = datetime.now().isoformat()
-                save_tracked_users()
-                print(f"Status updated for user {user_id}: {user_data['last_status']} -> {current_status}")
-            except Exception as e:
-                print(f"Error sending message to {user_id}: {e}")
-        else:
-            print(f"No status change for user {user_id}: {current_status}")
+        snapshot_changed |= check_source_status_changes(source)
+        checked += 1
+    
+    if not checked:
+        status_check_cycles.inc('skipped')
+        return False
+    status_check_cycles.inc('completed')
+    return snapshot_changed
+
+def check_source_status_changes(source):
+    """Diff one source against its previous check and queue notifications; returns True if any status code changed"""
+    diff_state = source['diff']
+    new_codes = source['cache']['data'].codes
+    # Only status codes count: a body that changed elsewhere, or just reordered, must not reset the cadence
+    changed_slots = get_changed_slots(source, new_codes)
+    snapshot_changed = changed_slots is None or bool(changed_slots)
+    subscribers = get_subscribers(source)
+    changes = get_status_changes(new_codes, changed_slots, subscribers, source)
+    status_check_changes.inc(source['name'], amount=len(changes))
+    logger.info(f"Found {len(changes)} {source['name']} status change(s)")
+    
+    if changes:
+        enqueue_status_changes(changes, source)
+        scheduler.modify_job('notification_delivery', next_run_time=datetime.now())
+    
+    diff_state['codes'] = new_codes
+    diff_state['tracked'] = subscribers
+    return snapshot_changed
+
+def run_adaptive_status_check():
+    """Check for status changes, then schedule the next check by how recently the feed changed
+
+    Only the leader drives the cadence. Followers keep the TTL published with
+    the leader's snapshot and look again at the minimum interval in case they
+    have to take over.
+    """
+    if scheduler_leader is not None and not scheduler_leader.is_leader():
+        scheduler.reschedule_job('status_check', trigger='interval', seconds=STATUS_CHECK_MIN_INTERVAL)
+        return
+    try:
+        status_check_cadence.record(check_status_changes())
+    finally:
+        schedule_next_status_check(status_check_cadence.next_delay())
+
+def get_check_interval_text():
+    def minutes(seconds):
+        return f"{seconds / 60:g}"
+    if STATUS_CHECK_MIN_INTERVAL == STATUS_CHECK_MAX_INTERVAL:
+        return f"{minutes(STATUS_CHECK_MIN_INTERVAL)} minutes"
+    return f"{minutes(STATUS_CHECK_MIN_INTERVAL)}-{minutes(STATUS_CHECK_MAX_INTERVAL)} minutes, faster while reviews are moving"
 
-scheduler.add_job(check_status_changes, 'interval', minutes=5)
+def schedule_next_status_check(delay):
+    for source in submission_sources.values():
+        if source['ttl'] is None:
+            source['cache']['cache_duration'] = timedelta(seconds=delay * SUBMISSIONS_CACHE_RATIO)
+            publish_cache_duration(source)
+    status_check_interval.set(delay)
+    scheduler.reschedule_job('status_check', trigger='interval', seconds=delay)
+    if SUBMISSIONS_BACKGROUND_REFRESH:
+        scheduler.reschedule_job('submissions_refresh', trigger='interval',
+                                 seconds=delay * SUBMISSIONS_CACHE_RATIO * 0.8)
+    logger.debug(f"Next status check in {delay:.0f}s")
 
-@slack_app.message("track status")
+scheduler.add_job(run_adaptive_status_check, 'interval', id='status_check', seconds=STATUS_CHECK_MIN_INTERVAL)
+scheduler.add_job(run_as_leader, 'interval', id='notification_delivery', args=[deliver_notifications],
+                  seconds=NOTIFICATION_DRAIN_INTERVAL, coalesce=True)
+status_check_interval.set(STATUS_CHECK_MIN_INTERVAL)
+if SUBMISSIONS_BACKGROUND_REFRESH:
+    scheduler.add_job(run_as_leader, 'interval', id='submissions_refresh', args=[refresh_submissions_ahead],
+                      seconds=submissions_cache['cache_duration'].total_seconds() * 0.8)
+
+def load_snapshot_file(source=default_source):
+    """Serve the snapshot saved by the last run as stale data until the first fetch replaces it"""
+    snapshot_file = source['snapshot_file']
+    if snapshot_file is None:
+        return
+    started = time.perf_counter()
+    with source['lock']:
+        if not adopt_shared_snapshot(snapshot_file.read(), source):
+            return
+        # The saved TTL belongs to the previous run's cadence, which the leader restarts at the minimum;
+        # a follower keeps the TTL the leader published
+        if source['ttl'] is None and (scheduler_leader is None or scheduler_leader.is_leader()):
+            source['cache']['cache_duration'] = timedelta(seconds=STATUS_CHECK_MIN_INTERVAL * SUBMISSIONS_CACHE_RATIO)
+    logger.info(f"Loaded {source['cache']['data'].submission_count} {source['name']} submissions from "
+                f"{snapshot_file.path} in {(time.perf_counter() - started) * 1000:.0f}ms, {get_snapshot_age(source)}s old")
+
+def warm_slack_profiles():
+    # Every worker keeps its own profile cache, so this runs outside run_as_leader
+    try:
+        found = slack_profiles.warm(list(tracked_users))
+        logger.info(f"Warmed {found} of {len(tracked_users)} tracked user profiles from users.list")
+    except Exception as e:
+        logger.warning(f"Error warming Slack profiles: {e}")
+
+if SLACK_PROFILE_WARMUP:
+    scheduler.add_job(warm_slack_profiles, 'interval', seconds=SLACK_PROFILE_CACHE_TTL * 0.8,
+                      next_run_time=datetime.now())
+
+@slack_listener('message', "track status")
 def handle_track_status(message, say):
     user_id = message['user']
     channel = message['channel']
@@ -242,135 +1378,135 @@ def handle_track_status(message, say):
     
     if current_status:
         emoji, status_name, description = get_status_emoji_and_description(current_status)
-        tracked_users[user_id] = {
-            'channel': channel,
-            'last_status': current_status,
-            'last_updated': datetime.now().isoformat()
-        }
-        save_tracked_users()
+        start_tracking(user_id, channel, current_status)
         try:
-            delete_bot_messages_in_dm(slack_app.client, user_id)
-            
-            slack_app.client.chat_postMessage(
-                channel=user_id,
+            send_dm(get_slack_client(), user_id,
                 text=f"✅ *YSWS Submission Tracking Started*\n\n"
                      f"📊 *Current Status:* {emoji} {status_name}\n"
                      f"💬 *Description:* {description}\n\n"
-                     f"⏰ *Check Interval:* Every 5 minutes\n"
+                     f"⏰ *Check Interval:* Every {get_check_interval_text()}\n"
                      f"🔔 *Notifications:* You'll receive updates here when your status changes\n"
                      f"🛑 *To stop tracking:* Use `/yswsdb-untrack` command\n\n"
                      f"*Last Updated:* {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}\n\n"
                      f"I'll monitor your submission and notify you immediately when your status changes!"
             )
         except Exception as e:
-            print(f"Error sending DM to {user_id}: {e}")
+            logger.error(f"Error sending DM to {user_id}: {e}")
         
         say(f"✅ *YSWS Submission Tracking Activated*\n\n"
             f"📊 *Current Status:* {emoji} {status_name}\n"
             f"💬 {description}\n\n"
-            f"⏰ *Check Interval:* Every 5 minutes\n"
+            f"⏰ *Check Interval:* Every {get_check_interval_text()}\n"
             f"🔔 *Notifications:* Direct messages when status changes\n"
             f"🛑 *To stop tracking:* Use `/untrack` command\n\n"
             f"I'll monitor your submission and notify you immediately when your status changes!")
-        print(f"Started tracking user {user_id} with status: {current_status}")
+        logger.info(f"Started tracking user {user_id} with status: {current_status}")
     else:
         say("❌ Could not find your submission. Make sure you have submitted to YSWS.")
 
-@slack_app.command("/yswsdb-track")
-def handle_track_command(ack, respond, command):
-    ack()
+def get_command_source(command):
+    """The source named in a slash command's text, or the default source; None for unknown names"""
+    return get_submission_source(command.get('text', '').strip())
+
+def get_unknown_source_text():
+    return "❌ Unknown submission source. Available sources: " + ", ".join(f"`{name}`" for name in submission_sources)
+
+@slack_listener('command', "/yswsdb-track")
+def handle_track_command(respond, command):
     user_id = command['user_id']
     channel = command['channel_id']
+    source = get_command_source(command)
+    if source is None:
+        respond(get_unknown_source_text())
+        return
     
-    current_status = get_user_submission_status(user_id)
+    current_status = get_user_submission_status(user_id, source)
     
     if current_status:
         emoji, status_name, description = get_status_emoji_and_description(current_status)
-        tracked_users[user_id] = {
-            'channel': channel,
-            'last_status': current_status,
-            'last_updated': datetime.now().isoformat()
-        }
-        save_tracked_users()
+        start_tracking(user_id, channel, current_status, source)
         try:
-            delete_bot_messages_in_dm(slack_app.client, user_id)
-            
-            slack_app.client.chat_postMessage(
-                channel=user_id,
-                text=f"✅ *YSWS Submission Tracking Started*\n\n"
+            send_dm(get_slack_client(), user_id,
+                text=f"✅ *{get_source_label(source)} Submission Tracking Started*\n\n"
                      f"📊 *Current Status:* {emoji} {status_name}\n"
                      f"💬 *Description:* {description}\n\n"
-                     f"⏰ *Check Interval:* Every 5 minutes\n"
+                     f"⏰ *Check Interval:* Every {get_check_interval_text()}\n"
                      f"🔔 *Notifications:* You'll receive updates here when your status changes\n"
                      f"🛑 *To stop tracking:* Use `/yswsdb-untrack` command\n\n"
                      f"*Last Updated:* {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}\n\n"
                      f"I'll monitor your submission and notify you immediately when your status changes!"
             )
         except Exception as e:
-            print(f"Error sending DM to {user_id}: {e}")
+            logger.error(f"Error sending DM to {user_id}: {e}")
         
-        respond(f"✅ *YSWS Submission Tracking Activated*\n\n"
+        respond(f"✅ *{get_source_label(source)} Submission Tracking Activated*\n\n"
                f"📊 *Current Status:* {emoji} {status_name}\n"
                f"📋 *Status Type:* {status_name}\n"
                f"💬 *Description:* {description}\n\n"
-               f"⏰ *Check Interval:* Every 5 minutes\n"
+               f"⏰ *Check Interval:* Every {get_check_interval_text()}\n"
                f"🔔 *Notifications:* Direct messages when status changes\n"
                f"🛑 *To stop tracking:* Use `/untrack` command\n\n"
                f"I'll monitor your submission and notify you immediately when your status changes!")
-        print(f"Started tracking user {user_id} with status: {current_status}")
+        logger.info(f"Started tracking user {user_id} in {source['name']} with status: {current_status}")
     else:
-        respond("❌ Could not find your submission. Make sure you have submitted to YSWS.")
+        respond(f"❌ Could not find your submission. Make sure you have submitted to {get_source_label(source)}.")
 
-@slack_app.command("/yswsdb-status")
-def handle_status_command(ack, respond, command):
-    ack()
+@slack_listener('command', "/yswsdb-status")
+def handle_status_command(respond, command):
     user_id = command['user_id']
+    source = get_command_source(command)
+    if source is None:
+        respond(get_unknown_source_text())
+        return
     
-    current_status = get_user_submission_status(user_id)
+    current_status = get_user_submission_status(user_id, source)
     
     if current_status:
         emoji, status_name, description = get_status_emoji_and_description(current_status)
-        respond(f"📊 *Your Current YSWS Submission Status*\n\n"
+        respond(f"📊 *Your Current {get_source_label(source)} Submission Status*\n\n"
                f"{emoji} *Status:* {current_status}\n"
                f"📋 *Type:* {status_name}\n"
                f"💬 *Description:* {description}")
     else:
-        respond("❌ Could not find your submission. Make sure you have submitted to YSWS.")
+        respond(f"❌ Could not find your submission. Make sure you have submitted to {get_source_label(source)}.")
 
-@slack_app.command("/yswsdb-untrack")
-def handle_untrack_command(ack, respond, command):
-    ack()
+@slack_listener('command', "/yswsdb-untrack")
+def handle_untrack_command(respond, command):
     user_id = command['user_id']
+    source = get_command_source(command)
+    if source is None:
+        respond(get_unknown_source_text())
+        return
     
-    if user_id in tracked_users:
-        del tracked_users[user_id]
-        save_tracked_users()
-        respond("🔕 Stopped tracking your submission status.")
-        print(f"Stopped tracking user {user_id}")
+    if stop_tracking(user_id, source):
+        if source is default_source:
+            respond("🔕 Stopped tracking your submission status.")
+        else:
+            respond(f"🔕 Stopped tracking your {get_source_label(source)} submission status.")
+        logger.info(f"Stopped tracking user {user_id} in {source['name']}")
     else:
         respond("❌ You are not currently being tracked.")
 
-@slack_app.command("/list")
-def handle_list_command(ack, respond, command):
-    ack()
+@slack_listener('command', "/list")
+def handle_list_command(respond, command):
     
     if tracked_users:
         user_count = len(tracked_users)
         user_list = []
-        for uid, data in tracked_users.items():
-            emoji, status_name, _ = get_status_emoji_and_description(data['last_status'])
-            user_list.append(f"• <@{uid}>: {emoji} {data['last_status']}")
+        for uid in list(tracked_users):
+            for source, state in get_subscriptions(uid):
+                emoji, status_name, _ = get_status_emoji_and_description(state['last_status'])
+                source_text = "" if source is default_source else f" ({source['name']})"
+                user_list.append(f"• <@{uid}>{source_text}: {emoji} {state['last_status']}")
         
         respond(f"📋 *Currently tracking {user_count} user(s):*\n\n" + "\n".join(user_list))
     else:
         respond("📋 No users are currently being tracked.")
 
-@slack_app.command("/yswsdb-web")
-def handle_ysws_web_command(ack, respond, command):
-    ack()
+@slack_listener('command', "/yswsdb-web")
+def handle_ysws_web_command(respond, command):
     user_id = command['user_id']
-    current_status = get_user_submission_status(user_id)
-    if current_status:
+    if any(get_user_submission_status(user_id, source) for source in submission_sources.values()):
         respond({
             "blocks": [
                 {
@@ -399,220 +1535,299 @@ def handle_ysws_web_command(ack, respond, command):
     else:
         respond("No submission found for your Slack ID.")
 
+slack_delivery_cache = TTLCache(max_size=SLACK_DEDUPE_SIZE, ttl=SLACK_DEDUPE_TTL)
+
+def get_slack_delivery_key(body, content_type):
+    """Identify a Slack delivery so redeliveries of it map to the same key"""
+    try:
+        if content_type.startswith('application/json'):
+            event_id = json.loads(body).get('event_id')
+            if event_id:
+                return 'event', event_id
+        else:
+            form = parse_qs(body)
+            if 'payload' in form:
+                payload = json.loads(form['payload'][0])
+                trigger_id = payload.get('trigger_id')
+            else:
+                trigger_id = form.get('trigger_id', [None])[0]
+            if trigger_id:
+                return 'trigger', trigger_id
+    except (ValueError, AttributeError):
+        pass
+    # Retries carry a new timestamp and signature but the same body
+    return 'body', hashlib.sha256(body.encode()).hexdigest()
+
+def is_known_delivery(kind, key):
+    """True if this worker, or with several workers any of them, already handled the delivery"""
+    if slack_delivery_cache.get((kind, key)):
+        return True
+    if slack_delivery_log is None:
+        return False
+    try:
+        return slack_delivery_log.contains(f"{kind}:{key}")
+    except sqlite3.Error as e:
+        logger.warning(f"Could not look up Slack delivery {kind}:{key}: {e}")
+        return False
+
+def remember_delivery(kind, key):
+    slack_delivery_cache.set((kind, key), True)
+    if slack_delivery_log is None:
+        return
+    try:
+        slack_delivery_log.add(f"{kind}:{key}")
+    except sqlite3.Error as e:
+        logger.warning(f"Could not record Slack delivery {kind}:{key}: {e}")
+
 @app.route("/slack/events", methods=["POST"])
 def slack_events():
-    return handler.handle(request)
+    kind, key = get_slack_delivery_key(request.get_data(as_text=True), request.content_type or '')
+    if is_known_delivery(kind, key):
+        slack_deliveries.inc(kind, 'true')
+        logger.debug(f"Acked duplicate Slack delivery {kind}:{key} "
+                     f"(retry {request.headers.get('X-Slack-Retry-Num', '0')}, {request.headers.get('X-Slack-Retry-Reason', 'none')})")
+        return Response(status=200, headers={'X-Slack-No-Retry': '1'})
+    
+    response = slack_state['handler'].handle(request)
+    # Only remember deliveries Bolt accepted, so unsigned requests cannot suppress real ones
+    if response.status_code < 400:
+        remember_delivery(kind, key)
+        slack_deliveries.inc(kind, 'false')
+    return response
 
-@slack_app.event("app_home_opened")
-def update_home_tab(client, event, logger):
-    try:
-        user_id = event["user"]
+# Hash of the last view published to each user, so unchanged home tabs are not republished
+home_view_hashes = TTLCache(max_size=HOME_VIEW_CACHE_SIZE, ttl=HOME_VIEW_CACHE_TTL)
 
-        is_tracked = user_id in tracked_users
-        current_status = get_user_submission_status(user_id)
+HOME_VIEW_LAST_UPDATED = '%LAST_UPDATED%'
 
-        status_text = ""
-        if is_tracked and current_status:
-            emoji, status_name, description = get_status_emoji_and_description(current_status)
-            last_updated = tracked_users[user_id].get('last_updated', 'Unknown')
-            if last_updated != 'Unknown':
-                formatted_time = last_updated[:19].replace('T', ' ') + ' UTC'
-            else:
-                formatted_time = 'Unknown'
-            status_text = f"\n\n📊 *Current Status:* {emoji} {status_name}\n💬 {description}\n🕐 *Last Updated:* {formatted_time}"
-        
-        client.views_publish(
-            user_id=user_id,
-            view={
-                "type": "home",
-                "blocks": [
+@functools.lru_cache(maxsize=64)
+def get_home_view_template(is_tracked, current_status, other_statuses=()):
+    """Render the home tab for (tracked?, status) once, as JSON with a placeholder for the update time
+
+    other_statuses holds (source name, status) for the user's subscriptions to the other sources.
+    """
+    status_text = ""
+    if is_tracked and current_status:
+        emoji, status_name, description = get_status_emoji_and_description(current_status)
+        status_text = f"\n\n📊 *Current Status:* {emoji} {status_name}\n💬 {description}\n🕐 *Last Updated:* {HOME_VIEW_LAST_UPDATED}"
+    for name, status in other_statuses:
+        emoji, status_name, _ = get_status_emoji_and_description(status)
+        status_text += f"\n\n📊 *{get_source_label(submission_sources[name])}:* {emoji} {status_name}"
+    
+    return json.dumps({
+        "type": "home",
+        "blocks": [
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": f"*Welcome to YSWS Status Tracker!* 🏠\n\nTrack your submission status and get notified of changes automatically.{status_text}"
+                }
+            },
+            {
+                "type": "divider"
+            },
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": "*Quick Actions:*"
+                }
+            },
+            {
+                "type": "actions",
+                "elements": [
                     {
-                        "type": "section",
+                        "type": "button",
                         "text": {
-                            "type": "mrkdwn",
-                            "text": f"*Welcome to YSWS Status Tracker!* 🏠\n\nTrack your submission status and get notified of changes automatically.{status_text}"
-                        }
-                    },
-                    {
-                        "type": "divider"
+                            "type": "plain_text",
+                            "text": "🔔 Start Tracking" if not is_tracked else "🔄 Refresh Status"
+                        },
+                        "action_id": "start_tracking",
+                        "style": "primary"
                     },
                     {
-                        "type": "section",
+                        "type": "button",
                         "text": {
-                            "type": "mrkdwn",
-                            "text": "*Quick Actions:*"
-                        }
-                    },
-                    {
-                        "type": "actions",
-                        "elements": [
-                            {
-                                "type": "button",
-                                "text": {
-                                    "type": "plain_text",
-                                    "text": "🔔 Start Tracking" if not is_tracked else "🔄 Refresh Status"
-                                },
-                                "action_id": "start_tracking",
-                                "style": "primary"
-                            },
-                            {
-                                "type": "button",
-                                "text": {
-                                    "type": "plain_text",
-                                    "text": "📊 Check Status"
-                                },
-                                "action_id": "check_status"
-                            }
-                        ]
-                    },
+                            "type": "plain_text",
+                            "text": "📊 Check Status"
+                        },
+                        "action_id": "check_status"
+                    }
+                ]
+            },
+            {
+                "type": "actions",
+                "elements": [
                     {
-                        "type": "actions",
-                        "elements": [
-                            {
-                                "type": "button",
-                                "text": {
-                                    "type": "plain_text",
-                                    "text": "🔕 Stop Tracking"
-                                },
-                                "action_id": "stop_tracking",
-                                "style": "danger"
-                            },
-                            {
-                                "type": "button",
-                                "text": {
-                                    "type": "plain_text",
-                                    "text": "❓ Help"
-                                },
-                                "action_id": "show_help"
-                            }
-                        ]
+                        "type": "button",
+                        "text": {
+                            "type": "plain_text",
+                            "text": "🔕 Stop Tracking"
+                        },
+                        "action_id": "stop_tracking",
+                        "style": "danger"
                     },
                     {
-                        "type": "divider"
-                    },
+                        "type": "button",
+                        "text": {
+                            "type": "plain_text",
+                            "text": "❓ Help"
+                        },
+                        "action_id": "show_help"
+                    }
+                ]
+            },
+            {
+                "type": "divider"
+            },
+            {
+                "type": "context",
+                "elements": [
                     {
-                        "type": "context",
-                        "elements": [
-                            {
-                                "type": "mrkdwn",
-                                "text": "💡 *Tip: You can also use slash commands like `/yswsdb-track` in any channel*"
-                            }
-                        ]
+                        "type": "mrkdwn",
+                        "text": "💡 *Tip: You can also use slash commands like `/yswsdb-track` in any channel*"
                     }
                 ]
             }
-        )
+        ]
+    })
+
+def render_home_view(user_id):
+    is_tracked = is_tracking(user_id)
+    current_status = get_user_submission_status(user_id) if is_tracked else None
+    other_statuses = []
+    for source, _ in get_subscriptions(user_id):
+        status = get_user_submission_status(user_id, source) if source is not default_source else None
+        if status:
+            other_statuses.append((source['name'], status))
+    template = get_home_view_template(is_tracked, current_status, tuple(other_statuses))
+    if not (is_tracked and current_status):
+        return template
+    
+    last_updated = tracked_users[user_id].get('last_updated', 'Unknown')
+    if last_updated != 'Unknown':
+        formatted_time = last_updated[:19].replace('T', ' ') + ' UTC'
+    else:
+        formatted_time = 'Unknown'
+    return template.replace(HOME_VIEW_LAST_UPDATED, formatted_time)
+
+def publish_home_tab(client, user_id):
+    """Publish the home tab unless it is identical to the last view published to this user
+
+    The remembered views are per process, so with several workers another
+    one may have published since; every publish then goes out.
+    """
+    view = render_home_view(user_id)
+    remember = app.config['WEB_WORKERS'] == 1
+    if remember:
+        view_hash = hashlib.blake2b(view.encode(), digest_size=16).digest()
+        if home_view_hashes.get(user_id) == view_hash:
+            home_tab_publishes.inc('skipped')
+            return False
+    slack_call(client, 'views_publish', user_id=user_id, view=json.loads(view))
+    if remember:
+        home_view_hashes.set(user_id, view_hash)
+    home_tab_publishes.inc('published')
+    return True
+
+def refresh_home_tabs(user_ids):
+    """Republish the home tabs of tracked users whose status changed, in one batch through the dispatcher
+
+    Every user is republished, whether or not this process has seen them open
+    the tab, so tabs stay current after a restart and on a scheduler leader
+    that never serves app_home_opened. With a single worker, publish_home_tab
+    still skips views identical to the last one it published.
+    """
+    futures = [slack_dispatcher.submit(publish_home_tab, get_slack_client(), user_id)
+               for user_id in user_ids if user_id in tracked_users]
+    wait(futures)
+    for future in futures:
+        if future.exception() is not None:
+            logger.error(f"Error refreshing home tab: {future.exception()}")
+
+@slack_listener('event', "app_home_opened")
+def update_home_tab(client, event, logger):
+    try:
+        publish_home_tab(client, event["user"])
     except Exception as e:
-        print(f"Error publishing home tab: {e}")
+        logger.error(f"Error publishing home tab: {e}")
 
-@slack_app.action("start_tracking")
-def handle_start_tracking_button(ack, body, client):
-    ack()
+@slack_listener('action', "start_tracking")
+def handle_start_tracking_button(body, client):
     user_id = body["user"]["id"]
     
     current_status = get_user_submission_status(user_id)
     
     if current_status:
         emoji, status_name, description = get_status_emoji_and_description(current_status)
-        tracked_users[user_id] = {
-            'channel': user_id,
-            'last_status': current_status,
-            'last_updated': datetime.now().isoformat()
-        }
-        save_tracked_users()
-
-        delete_bot_messages_in_dm(client, user_id)
+        start_tracking(user_id, user_id, current_status)
 
-        client.chat_postMessage(
-            channel=user_id,
+        send_dm(client, user_id,
             text=f"✅ *YSWS Submission Tracking Started*\n\n"
                  f"📊 *Current Status:* {emoji} {status_name}\n"
                  f"💬 *Description:* {description}\n\n"
-                 f"⏰ *Check Interval:* Every 5 minutes\n"
+                 f"⏰ *Check Interval:* Every {get_check_interval_text()}\n"
                  f"🔔 *Notifications:* You'll receive updates here when your status changes\n"
                  f"🛑 *To stop tracking:* Use `/yswsdb-untrack` command\n\n"
                  f"*Last Updated:* {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
                  f"I'll monitor your submission and notify you immediately when your status changes!"
         )
 
-        update_home_tab(client, {"user": user_id}, print)
+        update_home_tab(client, {"user": user_id}, logger)
         
     else:
-        delete_bot_messages_in_dm(client, user_id)
-        
-        client.chat_postMessage(
-            channel=user_id,
+        send_dm(client, user_id,
             text="❌ Could not find your submission. Make sure you have submitted to YSWS."
         )
 
-@slack_app.action("check_status")
-def handle_check_status_button(ack, body, client):
-    ack()
+@slack_listener('action', "check_status")
+def handle_check_status_button(body, client):
     user_id = body["user"]["id"]
     current_status = get_user_submission_status(user_id)
     
     if current_status:
         emoji, status_name, description = get_status_emoji_and_description(current_status)
         
-        delete_bot_messages_in_dm(client, user_id)
-        
-        client.chat_postMessage(
-            channel=user_id,
+        send_dm(client, user_id,
             text=f"📊 *Your Current YSWS Submission Status*\n\n"
                  f"{emoji} *Status:* {status_name}\n"
                  f"💬 *Description:* {description}\n\n"
                  f"*Checked:* {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
         )
     else:
-        delete_bot_messages_in_dm(client, user_id)
-        
-        client.chat_postMessage(
-            channel=user_id,
+        send_dm(client, user_id,
             text="❌ Could not find your submission. Make sure you have submitted to YSWS."
         )
 
-@slack_app.action("stop_tracking")
-def handle_stop_tracking_button(ack, body, client):
-    ack()
+@slack_listener('action', "stop_tracking")
+def handle_stop_tracking_button(body, client):
     user_id = body["user"]["id"]
     
-    if user_id in tracked_users:
-        del tracked_users[user_id]
-        save_tracked_users()
-        
-        delete_bot_messages_in_dm(client, user_id)
-        
-        client.chat_postMessage(
-            channel=user_id,
+    if stop_tracking(user_id):
+        send_dm(client, user_id,
             text="🔕 *Tracking stopped!* You won't receive status update notifications anymore."
         )
 
-        update_home_tab(client, {"user": user_id}, print)
+        update_home_tab(client, {"user": user_id}, logger)
         
     else:
-        delete_bot_messages_in_dm(client, user_id)
-        
-        client.chat_postMessage(
-            channel=user_id,
+        send_dm(client, user_id,
             text="❌ You're not currently being tracked."
         )
 
-@slack_app.action("show_help")
-def handle_help_button(ack, body, client):
-    ack()
+@slack_listener('action', "show_help")
+def handle_help_button(body, client):
     user_id = body["user"]["id"]
     
-    delete_bot_messages_in_dm(client, user_id)
-    
-    client.chat_postMessage(
-        channel=user_id,
+    send_dm(client, user_id,
         text="*YSWS Status Tracker Help* 📚\n\n"
              "*Available Commands:*\n"
-             "• `/yswsdb-track` - Start tracking\n"
-             "• `/yswsdb-status` - Check current status\n"
-             "• `/yswsdb-untrack` - Stop tracking\n\n"
+             "• `/yswsdb-track [source]` - Start tracking\n"
+             "• `/yswsdb-status [source]` - Check current status\n"
+             "• `/yswsdb-untrack [source]` - Stop tracking\n\n"
              "*Features:*\n"
-             "• Automatic status checking every 5 minutes\n"
+             f"• Automatic status checking every {get_check_interval_text()}\n"
              "• Direct message notifications on changes\n"
              "• AI-powered friendly status updates\n"
              "• Interactive buttons in bot profile\n\n"
@@ -623,13 +1838,76 @@ def handle_help_button(ack, body, client):
              "*Need help?* Contact your YSWS administrator."
     )
 
+def get_bot_user_id(client):
+    if bot_identity['user_id'] is None:
+        bot_identity['user_id'] = slack_call(client, 'auth_test')["user_id"]
+    return bot_identity['user_id']
+
+def resolve_bot_identity():
+    """Call auth.test once at startup, off the request path, and share the result with Bolt
+
+    Without it Bolt's authorization calls auth.test on the thread of the
+    first Slack request, which must be acknowledged within three seconds.
+    """
+    try:
+        result = slack_call(get_slack_client(), 'auth_test')
+    except Exception as e:
+        logger.warning(f"Could not resolve the bot identity, Slack will resolve it on the first request: {e}")
+        return
+    bot_identity['user_id'] = result['user_id']
+    for middleware in slack_state['app']._middleware_list:
+        if isinstance(middleware, SingleTeamAuthorization) and middleware.auth_test_result is None:
+            middleware.auth_test_result = result
+
+def remember_bot_identity(context, next):
+    if bot_identity['user_id'] is None and context.bot_user_id:
+        bot_identity['user_id'] = context.bot_user_id
+    return next()
+
+def remember_bot_message(user_id, response):
+    """Keep a reference to the bot's latest DM in the tracked user's record, so it goes away with the user
+
+    Users who are not tracked keep no reference; their DM history is scanned instead.
+    """
+    user_data = tracked_users.get(user_id)
+    if user_data is not None:
+        user_data['last_bot_message'] = {'channel': response['channel'], 'ts': response['ts']}
+        save_tracked_user(user_id)
+
+def forget_bot_message(user_id):
+    user_data = tracked_users.get(user_id)
+    if user_data is not None and user_data.pop('last_bot_message', None) is not None:
+        save_tracked_user(user_id)
+
+def get_last_bot_message(user_id):
+    return tracked_users.get(user_id, {}).get('last_bot_message')
+
+def send_dm(client, user_id, text):
+    """Replace the bot's previous DM to a user with a new message"""
+    delete_bot_messages_in_dm(client, user_id)
+    response = slack_call(client, 'chat_postMessage', channel=user_id, text=text)
+    remember_bot_message(user_id, response)
+    return response
+
 def delete_bot_messages_in_dm(client, user_id):
-    """Delete previous bot messages in a DM channel with a user"""
+    """Delete previous bot messages in a DM channel with a user
+
+    The remembered message is deleted directly; without one, or when that
+    delete fails, the DM history is scanned for the bot's messages instead.
+    """
+    message_ref = get_last_bot_message(user_id)
+    if message_ref is not None:
+        forget_bot_message(user_id)
+        try:
+            slack_call(client, 'chat_delete', channel=message_ref['channel'], ts=message_ref['ts'])
+            return
+        except Exception as e:
+            logger.warning(f"Could not delete message {message_ref['ts']}, scanning the DM instead: {e}")
+    
     try:
-        bot_info = client.auth_test()
-        bot_user_id = bot_info["user_id"]
+        bot_user_id = get_bot_user_id(client)
         
-        response = client.conversations_history(
+        response = slack_call(client, 'conversations_history',
             channel=user_id,
             limit=100
         )
@@ -640,15 +1918,15 @@ def delete_bot_messages_in_dm(client, user_id):
             for message in messages:
                 if message.get("user") == bot_user_id:
                     try:
-                        client.chat_delete(
+                        slack_call(client, 'chat_delete',
                             channel=user_id,
                             ts=message["ts"]
                         )
                     except Exception as e:
-                        print(f"Could not delete message {message['ts']}: {e}")
+                        logger.warning(f"Could not delete message {message['ts']}: {e}")
                         
     except Exception as e:
-        print(f"Error deleting bot messages for user {user_id}: {e}")
+        logger.error(f"Error deleting bot messages for user {user_id}: {e}")
 
 @app.route('/')
 def index():
@@ -702,9 +1980,13 @@ def login():
 #     return redirect(url_for('dashboard'))
 
 @app.route('/dashboard')
+@rate_limited('dashboard')
 def dashboard():
     if 'user_id' not in session:
         return redirect(url_for('index'))
+    source = get_requested_source()
+    if source is None:
+        return redirect(url_for('dashboard'))
     
     user_id = session['user_id']
     # OAuth user info fetching commented out - using manual login only
@@ -721,8 +2003,13 @@ def dashboard():
     #         session['user_email'] = user_data['user'].get('email', '')
     #         session['user_image'] = user_data['user']['image_192']
     
-    current_status = get_user_submission_status(user_id)
-    is_tracked = user_id in tracked_users
+    try:
+        snapshot = get_cached_submissions(source=source)
+    except Exception:
+        snapshot = None
+    current_status = snapshot.get_status(user_id) if snapshot is not None else None
+    tracking_data = get_source_state(tracked_users[user_id], source) if user_id in tracked_users else None
+    is_tracked = tracking_data is not None
     
     status_info = None
     if current_status:
@@ -736,7 +2023,6 @@ def dashboard():
     
     tracking_info = None
     if is_tracked:
-        tracking_data = tracked_users[user_id]
         last_updated = tracking_data.get('last_updated', 'Unknown')
         if last_updated != 'Unknown':
             formatted_time = last_updated[:19].replace('T', ' ') + ' UTC'
@@ -744,45 +2030,100 @@ def dashboard():
             formatted_time = 'Unknown'
         tracking_info = {
             'last_updated': formatted_time,
-            'check_interval': '5 minutes'
+            'check_interval': get_check_interval_text()
         }
     
-    return render_template('dashboard.html', 
-                         user_name=session.get('user_name', 'User'),
-                         user_image=session.get('user_image', ''),
-                         status_info=status_info,
-                         is_tracked=is_tracked,
-                         tracking_info=tracking_info,
-                         is_manual_login=is_manual_login)
+    user_name = session.get('user_name', 'User')
+    user_image = session.get('user_image', '')
+    
+    snapshot_age = g.get('snapshot_age')
+    
+    def render():
+        return render_template('dashboard.html', 
+                             user_name=user_name,
+                             user_image=user_image,
+                             status_info=status_info,
+                             is_tracked=is_tracked,
+                             tracking_info=tracking_info,
+                             is_manual_login=is_manual_login,
+                             check_interval=get_check_interval_text(),
+                             snapshot_age_minutes=None if snapshot_age is None else snapshot_age // 60,
+                             source_name=source['name'],
+                             source_names=list(submission_sources),
+                             source_query='' if source is default_source else f"?source={source['name']}")
+    
+    if snapshot is None:
+        return render()
+    etag = get_response_etag(snapshot.version, current_status, is_tracked,
+                             tracking_info and tracking_info['last_updated'],
+                             user_id, user_name, user_image, is_manual_login,
+                             None if snapshot_age is None else snapshot_age // 60, source['name'])
+    return conditional_response(etag, snapshot, render, private=True, source=source)
+
+@app.route('/api/stream')
+def api_stream():
+    if 'user_id' not in session:
+        return jsonify({'error': 'Not authenticated'}), 401
+    
+    source = get_requested_source()
+    if source is None:
+        return jsonify({'error': 'Unknown submission source'}), 404
+    
+    user_id = session['user_id']
+    key = (user_id, source['name'])
+    events = status_stream_hub.subscribe(key)
+    if events is None:
+        return jsonify({'error': 'Too many open streams'}), 503, {'Retry-After': '30'}
+    
+    return Response(
+        status_stream_hub.stream(key, events, get_status_event(get_user_submission_status(user_id, source))),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/api/status')
+@rate_limited('dashboard')
+def api_status():
+    """The dashboard polls this when it cannot hold an event stream open"""
+    if 'user_id' not in session:
+        return jsonify({'error': 'Not authenticated'}), 401
+    source = get_requested_source()
+    if source is None:
+        return jsonify({'error': 'Unknown submission source'}), 404
+    
+    return jsonify(get_status_event(get_user_submission_status(session['user_id'], source)))
 
 @app.route('/api/track', methods=['POST'])
+@rate_limited('track')
 def api_track():
     if 'user_id' not in session:
         return jsonify({'error': 'Not authenticated'}), 401
     
+    source = get_requested_source()
+    if source is None:
+        return jsonify({'error': 'Unknown submission source'}), 404
+    
     user_id = session['user_id']
-    current_status = get_user_submission_status(user_id)
+    current_status = get_user_submission_status(user_id, source)
     
     if current_status:
-        tracked_users[user_id] = {
-            'channel': user_id,
-            'last_status': current_status,
-            'last_updated': datetime.now().isoformat()
-        }
-        save_tracked_users()
+        start_tracking(user_id, user_id, current_status, source)
         return jsonify({'success': True, 'message': 'Tracking started successfully'})
     else:
         return jsonify({'error': 'Submission not found'}), 404
 
 @app.route('/api/untrack', methods=['POST'])
+@rate_limited('track')
 def api_untrack():
     if 'user_id' not in session:
         return jsonify({'error': 'Not authenticated'}), 401
     
+    source = get_requested_source()
+    if source is None:
+        return jsonify({'error': 'Unknown submission source'}), 404
+    
     user_id = session['user_id']
-    if user_id in tracked_users:
-        del tracked_users[user_id]
-        save_tracked_users()
+    if stop_tracking(user_id, source):
         return jsonify({'success': True, 'message': 'Tracking stopped successfully'})
     else:
         return jsonify({'error': 'Not currently tracked'}), 400
@@ -793,41 +2134,92 @@ def logout():
     return redirect(url_for('index'))
 
 @app.route('/manual-login', methods=['POST'])
+@rate_limited('manual_login')
 def manual_login():
     slack_id = request.form.get('slack_id', '').strip()
     
     if not slack_id:
         return redirect(url_for('index'))
     
-    current_status = get_user_submission_status(slack_id)
+    # Participants of any source may log in; the dashboard opens on the first source that has them
+    source = next((source for source in submission_sources.values()
+                   if get_user_submission_status(slack_id, source)), None)
     
-    if current_status:
+    if source is not None:
         session['user_id'] = slack_id
-        slack_user_name = None
-        slack_user_image = ''
-        try:
-            slack_token = SLACK_BOT_TOKEN
-            user_info = requests.get(
-                'https://slack.com/api/users.info',
-                params={'user': slack_id},
-                headers={'Authorization': f'Bearer {slack_token}'}
-            ).json()
-            print(user_info)
-            if user_info.get('ok'):
-                slack_user_name = user_info['user'].get('real_name', f'Slack User - {slack_id[:8]}')
-                slack_user_image = user_info['user'].get('profile', {}).get('image_192', '')
-        except Exception:
-            slack_user_name = f'Slack User - {slack_id[:8]}'
-            slack_user_image = ''
-        session['user_name'] = slack_user_name or f'Slack User - {slack_id[:8]}'
-        session['user_image'] = slack_user_image
+        profile = get_login_profile(slack_id)
+        session['user_name'] = profile['name'] or f'Slack User - {slack_id[:8]}'
+        session['user_image'] = profile['image']
         session['manual_login'] = True
-        return redirect(url_for('dashboard'))
+        if source is default_source:
+            return redirect(url_for('dashboard'))
+        return redirect(url_for('dashboard', source=source['name']))
     else:
         return render_template('login.html', error=f'No submission found for Slack ID: {slack_id}')
 
+# Switches that only change what create_app() does, with their defaults
+STARTUP_OPTIONS = {'START_SCHEDULER': True, 'LOAD_SNAPSHOT': True}
+
+def create_app(config=None):
+    """Start the module's Flask app: check the Slack credentials, build the Bolt app, open the stores, load saved state and start the scheduler
+
+    This is not a factory. Routes and listeners are declared on the
+    module-level app at import, so there is one app per process, and only
+    the first call starts it. config may override any app.config setting,
+    such as TRACKED_USERS_DB or WEB_WORKERS; START_SCHEDULER=False and
+    LOAD_SNAPSHOT=False skip starting background jobs and loading the saved
+    snapshot. Unknown keys raise ValueError, and so does a later call that
+    asks for settings other than the ones the app was started with.
+    """
+    config = dict(config or {})
+    unknown = config.keys() - STARTUP_OPTIONS.keys() - app.config.keys()
+    if unknown:
+        raise ValueError(f"Unknown create_app() settings: {', '.join(sorted(unknown))}")
+    with startup_lock:
+        if startup_state['started']:
+            conflicting = sorted(key for key, value in config.items() if get_startup_setting(key) != value)
+            if conflicting:
+                raise ValueError(f"create_app() was already called with different {', '.join(conflicting)}")
+            return app
+        
+        if not SLACK_BOT_TOKEN:
+            raise ValueError("SLACK_BOT_TOKEN environment variable is required")
+        if not SLACK_SIGNING_SECRET:
+            raise ValueError("SLACK_SIGNING_SECRET environment variable is required")
+        if config.get('WEB_WORKERS', app.config['WEB_WORKERS']) > 1 and not FLASK_SECRET_KEY and 'SECRET_KEY' not in config:
+            raise ValueError("FLASK_SECRET_KEY is required with WEB_WORKERS > 1, "
+                             "otherwise each worker signs sessions with its own random key")
+        for key, default in STARTUP_OPTIONS.items():
+            startup_state[key] = config.pop(key, default)
+        app.config.update(config)
+        
+        slack_state['app'] = build_slack_app()
+        slack_state['handler'] = SlackRequestHandler(slack_state['app'])
+        open_state_files()
+        with tracked_users_lock:
+            tracked_users.update(load_tracked_users())
+            index_subscriptions()
+        if startup_state['LOAD_SNAPSHOT']:
+            for source in submission_sources.values():
+                load_snapshot_file(source)
+        # Every change is already written per user; a full rewrite from one worker's
+        # view would drop users added by the others
+        if app.config['WEB_WORKERS'] == 1:
+            atexit.register(save_tracked_users)
+        threading.Thread(target=resolve_bot_identity, name='bot-identity', daemon=True).start()
+        if startup_state['START_SCHEDULER']:
+            scheduler.start()
+        startup_state['started'] = True
+    logger.info(f"Started with {len(tracked_users)} tracked users")
+    return app
+
+def get_startup_setting(key):
+    if key in STARTUP_OPTIONS:
+        return startup_state[key]
+    return app.config[key]
+
 if __name__ == '__main__':
-    print(f"Starting bot with {len(tracked_users)} tracked users loaded from file")
+    create_app()
     for user_id, data in tracked_users.items():
-        print(f"  - User {user_id}: {data['last_status']}")
+        logger.info(f"  - User {user_id}: {data.get('last_status')}")
     app.run(host='0.0.0.0', port=8721, debug=False)
\ No newline at end of file
@@ -0,0 +1,258 @@
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from bench.stubs import StubServer, SubmissionsFeed, SubmissionsHandler, make_slack_id, start_stubs
+
+
+def summarize(name, timings, **details):
+    timings = sorted(timings)
+    result = {
+        'benchmark': name,
+        'iterations': len(timings),
+        'mean_ms': statistics.fmean(timings) * 1000,
+        'p50_ms': timings[len(timings) // 2] * 1000,
+        'p95_ms': timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000,
+        'max_ms': timings[-1] * 1000
+    }
+    result.update(details)
+    return result
+
+
+def timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    value = fn(*args, **kwargs)
+    return time.perf_counter() - started, value
+
+
+def get_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_api_env(stubs, workdir, verbose=False):
+    """Environment that points api.py at the local stand-ins, with its state files kept in workdir"""
+    return {
+        'LOG_LEVEL': 'INFO' if verbose else 'OFF',
+        'SLACK_BOT_TOKEN': 'xoxb-bench',
+        'SLACK_SIGNING_SECRET': 'bench',
+        'FLASK_SECRET_KEY': 'bench',
+        'SLACK_API_URL': f"{stubs['slack'].url}/api/",
+        'AI_COMPLETIONS_URL': f"{stubs['ai'].url}/chat/completions",
+        'SUBMISSIONS_URL': stubs['submissions'].url,
+        'TRACKED_USERS_DB': os.path.join(workdir, 'tracked_users.db'),
+        'SHARED_STATE_DIR': workdir,
+        # The benchmarks drive every route from one client far past the per-client budgets
+        'RATE_LIMITS': 'off'
+    }
+
+
+def import_api(stubs, workdir, verbose=False):
+    """Import api.py against the local stand-ins, with its state files kept in workdir"""
+    os.environ.update(get_api_env(stubs, workdir, verbose))
+    os.chdir(workdir)
+    import api
+    api.create_app({'START_SCHEDULER': False})
+    return api
+
+
+def reset_submissions(api, url):
+    api.default_source['url'] = url
+    api.submissions_cache.update({'data': None, 'last_updated': None, 'last_attempt': None,
+                                  'etag': None, 'last_modified': None, 'content_hash': None})
+    api.status_diff_state.update({'codes': None, 'tracked': set()})
+
+
+def expire_submissions(api):
+    api.submissions_cache['last_updated'] = datetime.now() - api.submissions_cache['cache_duration'] * 2
+
+
+def bench_get_cached_submissions(api, feed, iterations, churn):
+    results = []
+
+    timings = []
+    for _ in range(iterations):
+        api.submissions_cache.update({'data': None, 'etag': None, 'content_hash': None})
+        timings.append(timed(api.get_cached_submissions)[0])
+    results.append(summarize('get_cached_submissions', timings, case='cold'))
+
+    timings = [timed(api.get_cached_submissions)[0] for _ in range(iterations * 100)]
+    results.append(summarize('get_cached_submissions', timings, case='fresh'))
+
+    timings = []
+    for _ in range(iterations):
+        expire_submissions(api)
+        timings.append(timed(api.get_cached_submissions, allow_stale=False)[0])
+    results.append(summarize('get_cached_submissions', timings, case='not_modified'))
+
+    timings = []
+    for _ in range(iterations):
+        feed.advance(churn)
+        expire_submissions(api)
+        timings.append(timed(api.get_cached_submissions, allow_stale=False)[0])
+    results.append(summarize('get_cached_submissions', timings, case='changed', churn=churn))
+    return results
+
+
+def track_users(api, feed, users):
+    api.tracked_users.clear()
+    now = datetime.now().isoformat()
+    for i in random.sample(range(feed.count), min(users, feed.count)):
+        user_id = make_slack_id(i)
+        api.tracked_users[user_id] = {'channel': user_id, 'last_status': feed.status_of(i), 'last_updated': now}
+    with api.tracked_users_lock:
+        api.index_subscriptions()
+    api.save_tracked_users()
+    api.status_diff_state.update({'codes': None, 'tracked': set()})
+
+
+def bench_check_status_changes(api, feed, stubs, users, iterations, churn):
+    track_users(api, feed, users)
+    expire_submissions(api)
+    api.check_status_changes()
+    api.deliver_notifications()
+
+    timings = []
+    delivery_timings = []
+    changes = []
+    slack_calls = []
+    for _ in range(iterations):
+        feed.advance(churn)
+        expire_submissions(api)
+        before = {user_id: data['last_status'] for user_id, data in api.tracked_users.items()}
+        calls_before = len(stubs['slack_calls'])
+        timings.append(timed(api.check_status_changes)[0])
+        delivery_timings.append(timed(api.deliver_notifications)[0])
+        changes.append(sum(1 for user_id, data in api.tracked_users.items() if before.get(user_id) != data['last_status']))
+        slack_calls.append(len(stubs['slack_calls']) - calls_before)
+    return [
+        summarize('check_status_changes', timings, users=len(api.tracked_users), churn=churn),
+        summarize('deliver_notifications', delivery_timings, users=len(api.tracked_users), churn=churn,
+                  changes_found=sum(changes), slack_calls=sum(slack_calls))
+    ]
+
+
+def bench_status_route(api, feed, client, requests_count):
+    ids = [make_slack_id(random.randrange(feed.count)) for _ in range(requests_count)]
+    api.get_cached_submissions()
+    timings = []
+    for slack_id in ids:
+        elapsed, response = timed(client.get, f'/status/{slack_id}')
+        if response.status_code != 200:
+            raise RuntimeError(f"/status/{slack_id} returned {response.status_code}")
+        timings.append(elapsed)
+    return summarize('/status/<id>', timings)
+
+
+def bench_status_batch_route(api, feed, client, requests_count, batch_size=100):
+    api.get_cached_submissions()
+    timings = []
+    for _ in range(max(1, requests_count // 10)):
+        ids = [make_slack_id(random.randrange(feed.count)) for _ in range(batch_size)]
+        elapsed, response = timed(client.post, '/status/batch', json={'slack_ids': ids})
+        if response.status_code != 200:
+            raise RuntimeError(f"/status/batch returned {response.status_code}")
+        timings.append(elapsed)
+    return summarize('/status/batch', timings, batch_size=batch_size)
+
+
+def bench_dashboard_route(api, feed, client, requests_count):
+    api.get_cached_submissions()
+    timings = []
+    for _ in range(requests_count):
+        slack_id = make_slack_id(random.randrange(feed.count))
+        with client.session_transaction() as session:
+            session['user_id'] = slack_id
+            session['user_name'] = 'Bench'
+            session['manual_login'] = True
+        elapsed, response = timed(client.get, '/dashboard')
+        if response.status_code != 200:
+            raise RuntimeError(f"/dashboard returned {response.status_code}")
+        timings.append(elapsed)
+    return summarize('/dashboard', timings, tracked_users=len(api.tracked_users))
+
+
+def run(args):
+    random.seed(args.seed)
+    stubs = start_stubs(1, slack_latency=args.slack_latency,
+                        rate_limit_probability=args.rate_limit_probability, ai_latency=args.ai_latency)
+    workdir = tempfile.mkdtemp(prefix='statusbuddy-bench-')
+    api = import_api(stubs, workdir, verbose=args.verbose)
+    client = api.app.test_client()
+
+    results = []
+    for submissions in args.submissions:
+        feed = SubmissionsFeed(submissions, seed=args.seed)
+        server = StubServer(SubmissionsHandler, feed=feed).start()
+        try:
+            reset_submissions(api, server.url)
+            for result in bench_get_cached_submissions(api, feed, args.iterations, args.churn):
+                results.append(dict(result, submissions=submissions))
+            for users in args.users:
+                if users > submissions:
+                    continue
+                for result in bench_check_status_changes(api, feed, stubs, users, args.iterations, args.churn):
+                    results.append(dict(result, submissions=submissions))
+                results.append(dict(bench_status_route(api, feed, client, args.requests), submissions=submissions, users=users))
+                results.append(dict(bench_status_batch_route(api, feed, client, args.requests), submissions=submissions, users=users))
+                results.append(dict(bench_dashboard_route(api, feed, client, args.requests), submissions=submissions, users=users))
+        finally:
+            server.stop()
+
+    for name in ('submissions', 'slack', 'ai'):
+        stubs[name].stop()
+    return {
+        'revision': get_revision(),
+        'python': platform.python_version(),
+        'started_at': datetime.now(timezone.utc).isoformat(),
+        'config': vars(args),
+        'slack_dispatch': api.slack_dispatcher.get_stats(),
+        'metrics': api.metrics_registry.render(),
+        'results': results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the submissions, status check and web hot paths against local stand-ins")
+    parser.add_argument('--submissions', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--users', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--churn', type=float, default=0.01, help="fraction of submissions whose status changes between fetches")
+    parser.add_argument('--iterations', type=int, default=3)
+    parser.add_argument('--requests', type=int, default=200, help="requests per web route measurement")
+    parser.add_argument('--slack-latency', type=float, default=0.02)
+    parser.add_argument('--rate-limit-probability', type=float, default=0.01)
+    parser.add_argument('--ai-latency', type=float, default=0.2)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="write results to this file instead of stdout")
+    parser.add_argument('--verbose', action='store_true', help="keep the application's own output")
+    args = parser.parse_args()
+
+    with open(os.devnull, 'w') as devnull:
+        with contextlib.redirect_stdout(sys.stdout if args.verbose else devnull):
+            report = run(args)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
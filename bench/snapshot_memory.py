@@ -0,0 +1,67 @@
+import argparse
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snapshot import build_snapshot, iter_submissions
+
+STATUSES = ['0– Not started', '1– Pending review', '2– Approved']
+
+
+def make_payload(count):
+    submissions = []
+    for i in range(count):
+        submissions.append({
+            'id': f'rec{i:014d}',
+            'slackRealId': f'U{i:010d}',
+            'status': random.choice(STATUSES),
+            'name': f'Neighbour {i}',
+            'email': f'neighbour{i}@example.com',
+            'githubUsername': f'neighbour-{i}',
+            'codeUrl': f'https://github.com/neighbour-{i}/project',
+            'playableUrl': f'https://neighbour-{i}.github.io/project',
+            'description': 'A small project built for the Neighborhood YSWS program. ' * 4,
+            'hoursSpent': random.randint(1, 200),
+            'createdTime': '2025-06-01T12:00:00.000Z'
+        })
+    return json.dumps({'submissions': submissions}).encode()
+
+
+def measure(label, load, body):
+    tracemalloc.start()
+    result = load(body)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {'method': label, 'retained_bytes': current, 'peak_bytes': peak}
+
+
+def load_full(body):
+    return json.loads(body)
+
+
+def load_projected(body, chunk_size=64 * 1024):
+    chunks = (body[i:i + chunk_size] for i in range(0, len(body), chunk_size))
+    return build_snapshot(iter_submissions(chunks))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare memory of the full JSON payload with the projected snapshot")
+    parser.add_argument('--submissions', type=int, default=50000)
+    args = parser.parse_args()
+
+    body = make_payload(args.submissions)
+    results = {
+        'submissions': args.submissions,
+        'payload_bytes': len(body),
+        'results': [measure('full_json', load_full, body), measure('projected_stream', load_projected, body)]
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from bench.hot_paths import get_api_env, get_revision
+from bench.stubs import make_slack_id, start_stubs
+
+
+def run_child():
+    """Runs in a fresh interpreter: time importing api.py, create_app() and the first requests"""
+    timings = {}
+    started = time.perf_counter()
+    import api
+    timings['import_ms'] = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    if hasattr(api, 'create_app'):
+        app = api.create_app({'START_SCHEDULER': False})
+    else:
+        app = api.app
+        api.scheduler.pause()
+    timings['create_app_ms'] = (time.perf_counter() - started) * 1000
+
+    client = app.test_client()
+    for name, path in (('first_request_ms', f'/status/{make_slack_id(1)}'),
+                       ('second_request_ms', f'/status/{make_slack_id(2)}')):
+        started = time.perf_counter()
+        response = client.get(path)
+        timings[name] = (time.perf_counter() - started) * 1000
+        if response.status_code != 200:
+            raise RuntimeError(f"{path} returned {response.status_code}")
+    print(json.dumps(timings))
+
+
+def measure(stubs, workdir, verbose):
+    env = dict(os.environ, **get_api_env(stubs, workdir, verbose))
+    calls_before = len(stubs['slack_calls'])
+    fetches_before = dict(stubs['feed'].requests)
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child'], cwd=workdir, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result['slack_calls'] = len(stubs['slack_calls']) - calls_before
+    for kind, count in stubs['feed'].requests.items():
+        result[f'upstream_{kind}'] = count - fetches_before[kind]
+    return result
+
+
+def summarize(name, runs):
+    result = {'benchmark': name, 'runs': len(runs)}
+    for key in runs[0]:
+        result[key] = statistics.median(run[key] for run in runs)
+    return result
+
+
+def run(args):
+    stubs = start_stubs(args.submissions)
+    results = []
+    workdir = tempfile.mkdtemp(prefix='statusbuddy-startup-')
+    try:
+        results.append(summarize('first_start', [measure(stubs, workdir, args.verbose)]))
+        results.append(summarize('restart', [measure(stubs, workdir, args.verbose) for _ in range(args.runs)]))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+        for name in ('submissions', 'slack', 'ai'):
+            stubs[name].stop()
+    return {
+        'revision': get_revision(),
+        'python': platform.python_version(),
+        'started_at': datetime.now(timezone.utc).isoformat(),
+        'config': vars(args),
+        'results': results
+    }
+
+
+def main():
+    if '--child' in sys.argv:
+        run_child()
+        return
+    parser = argparse.ArgumentParser(description="Time importing api.py, create_app() and the first request in fresh processes")
+    parser.add_argument('--submissions', type=int, default=100000)
+    parser.add_argument('--runs', type=int, default=5, help="restarts measured against the state left by the first start")
+    parser.add_argument('--output', help="write results to this file instead of stdout")
+    parser.add_argument('--verbose', action='store_true', help="keep the application's own output")
+    args = parser.parse_args()
+
+    output = json.dumps(run(args), indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+import gzip
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+STATUSES = ['0– Not started', '1– Pending review', '2– Approved']
+
+
+def make_slack_id(i):
+    return f'U{i:010d}'
+
+
+class SubmissionsFeed:
+    """Synthetic getYSWSSubmissions payload whose statuses churn between generations"""
+
+    def __init__(self, count, seed=0):
+        self.random = random.Random(seed)
+        self.count = count
+        self.statuses = [self.random.choice(STATUSES) for _ in range(count)]
+        self.generation = 0
+        self.requests = {'full': 0, 'not_modified': 0}
+        self.lock = threading.Lock()
+        self.encode()
+
+    def encode(self):
+        submissions = [
+            {
+                'id': f'rec{i:014d}',
+                'slackRealId': make_slack_id(i),
+                'status': status,
+                'name': f'Neighbour {i}',
+                'codeUrl': f'https://github.com/neighbour-{i}/project',
+                'hoursSpent': i % 200
+            }
+            for i, status in enumerate(self.statuses)
+        ]
+        self.body = json.dumps({'submissions': submissions}).encode()
+        self.gzip_body = gzip.compress(self.body, compresslevel=1)
+        self.etag = f'"gen-{self.generation}"'
+
+    def advance(self, churn):
+        """Move a fraction of submissions to a different status and return how many changed"""
+        with self.lock:
+            changed = int(self.count * churn)
+            for i in self.random.sample(range(self.count), changed):
+                self.statuses[i] = self.random.choice([s for s in STATUSES if s != self.statuses[i]])
+            self.generation += 1
+            self.encode()
+            return changed
+
+    def status_of(self, i):
+        return self.statuses[i]
+
+
+class StubServer:
+    def __init__(self, handler_class, **attributes):
+        handler = type(handler_class.__name__, (handler_class,), attributes)
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.server.server_address
+        return f'http://{host}:{port}'
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class QuietHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def send_json(self, payload, status=200, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class SubmissionsHandler(QuietHandler):
+    feed = None
+
+    def do_GET(self):
+        feed = self.feed
+        with feed.lock:
+            etag, body, gzip_body = feed.etag, feed.body, feed.gzip_body
+            feed.requests['not_modified' if self.headers.get('If-None-Match') == etag else 'full'] += 1
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if 'gzip' in (self.headers.get('Accept-Encoding') or ''):
+            body = gzip_body
+            encoding = 'gzip'
+        else:
+            encoding = None
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('ETag', etag)
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class SlackHandler(QuietHandler):
+    latency = 0.02
+    rate_limit_probability = 0.0
+    users = 1000
+    calls = None
+
+    def do_POST(self):
+        method = self.path.partition('?')[0].rstrip('/').rsplit('/', 1)[-1]
+        body = self.read_body()
+        if self.headers.get('Content-Type', '').startswith('application/json'):
+            args = json.loads(body or b'{}')
+        else:
+            args = {key: values[0] for key, values in parse_qs(body.decode() or self.path.partition('?')[2]).items()}
+        time.sleep(self.latency)
+        self.calls.append(method)
+        if method != 'auth.test' and random.random() < self.rate_limit_probability:
+            self.send_json({'ok': False, 'error': 'ratelimited'}, status=429, headers={'Retry-After': '1'})
+            return
+        self.send_json(self.respond(method, args))
+
+    do_GET = do_POST
+
+    def respond(self, method, args):
+        if method == 'auth.test':
+            return {'ok': True, 'user_id': 'UBENCHBOT', 'bot_id': 'BBENCH', 'team_id': 'TBENCH', 'user': 'bench', 'team': 'bench', 'url': 'https://bench.slack.com/'}
+        if method == 'chat.postMessage':
+            return {'ok': True, 'channel': f"D{args.get('channel', '')}", 'ts': f'{time.time():.6f}'}
+        if method == 'conversations.history':
+            return {'ok': True, 'messages': [{'user': 'UBENCHBOT', 'ts': '1.000001'}]}
+        if method == 'users.info':
+            user_id = args.get('user', '')
+            return {'ok': True, 'user': {'id': user_id, 'real_name': f'Bench {user_id}', 'profile': {'image_192': ''}}}
+        if method == 'users.list':
+            start = int(args.get('cursor') or 0)
+            end = min(self.users, start + int(args.get('limit') or 200))
+            members = [{'id': make_slack_id(i), 'real_name': f'Bench {make_slack_id(i)}', 'profile': {'image_192': ''}}
+                       for i in range(start, end)]
+            return {'ok': True, 'members': members, 'response_metadata': {'next_cursor': str(end) if end < self.users else ''}}
+        return {'ok': True}
+
+
+class AIHandler(QuietHandler):
+    latency = 0.2
+
+    def do_POST(self):
+        self.read_body()
+        time.sleep(self.latency)
+        self.send_json({'choices': [{'message': {'content': 'Benchmark buddy message'}}]})
+
+
+def start_stubs(submissions, slack_latency=0.02, rate_limit_probability=0.0, ai_latency=0.2):
+    feed = SubmissionsFeed(submissions)
+    slack_calls = []
+    return {
+        'feed': feed,
+        'slack_calls': slack_calls,
+        'submissions': StubServer(SubmissionsHandler, feed=feed).start(),
+        'slack': StubServer(SlackHandler, latency=slack_latency, rate_limit_probability=rate_limit_probability, calls=slack_calls).start(),
+        'ai': StubServer(AIHandler, latency=ai_latency).start()
+    }
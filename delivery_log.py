@@ -0,0 +1,58 @@
+import sqlite3
+import threading
+import time
+
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS slack_deliveries (
+        delivery_key TEXT PRIMARY KEY,
+        recorded_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_slack_deliveries_recorded_at ON slack_deliveries (recorded_at)"
+)
+
+
+class SqliteDeliveryLog:
+    """Keys of recently handled Slack deliveries, shared by every worker through a WAL-mode SQLite database
+
+    A key recorded more than ttl seconds ago is treated as unknown. Expired
+    keys are pruned every prune_every additions.
+    """
+
+    def __init__(self, path, ttl=900.0, prune_every=256):
+        self.path = path
+        self.ttl = ttl
+        self.prune_every = prune_every
+        self.added = 0
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in SCHEMA:
+            self.connection.execute(statement)
+
+    def contains(self, key):
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT 1 FROM slack_deliveries WHERE delivery_key = ? AND recorded_at > ?",
+                (key, time.time() - self.ttl)
+            ).fetchone()
+        return row is not None
+
+    def add(self, key):
+        now = time.time()
+        with self.lock:
+            self.connection.execute(
+                "INSERT INTO slack_deliveries (delivery_key, recorded_at) VALUES (?, ?) "
+                "ON CONFLICT (delivery_key) DO UPDATE SET recorded_at = excluded.recorded_at",
+                (key, now)
+            )
+            self.added += 1
+            if self.added % self.prune_every == 0:
+                self.connection.execute("DELETE FROM slack_deliveries WHERE recorded_at <= ?", (now - self.ttl,))
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,102 @@
+import random
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class MessagePool:
+    """Keeps a few pre-generated message variants per key and refills them in the background"""
+
+    def __init__(self, generate, variants=3, ttl=6 * 60 * 60, max_keys=64, workers=2, recent_lookups=1024):
+        self.generate = generate
+        self.variants = variants
+        self.ttl = ttl
+        self.max_keys = max_keys
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='message-pool')
+        self.pool = OrderedDict()
+        self.refilling = set()
+        # Keys of the latest lookups, to rank warm-up candidates by recent use
+        self.lookups = deque(maxlen=recent_lookups)
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'refills': 0, 'refill_failures': 0, 'refill_time': 0.0}
+
+    def get_fresh_messages(self, key, now):
+        messages = [(created, message) for created, message in self.pool.get(key, []) if now - created < self.ttl]
+        if messages:
+            self.pool[key] = messages
+            self.pool.move_to_end(key)
+        else:
+            self.pool.pop(key, None)
+        return messages
+
+    def get(self, key):
+        """Return a pooled variant for key, or None; never waits on generation"""
+        with self.lock:
+            self.lookups.append(key)
+            messages = self.get_fresh_messages(key, time.monotonic())
+            if messages:
+                self.stats['hits'] += 1
+            else:
+                self.stats['misses'] += 1
+        self.prefetch(key)
+        if messages:
+            return random.choice(messages)[1]
+        return None
+
+    def prefetch(self, key):
+        with self.lock:
+            if key in self.refilling:
+                return
+            if len(self.get_fresh_messages(key, time.monotonic())) >= self.variants:
+                return
+            self.refilling.add(key)
+        self.executor.submit(self.refill, key)
+
+    def warm(self, keys):
+        """Prefetch the max_keys most recently used of keys; returns the keys prefetched
+
+        Ties keep the order of keys. Warming more keys than the pool holds
+        would evict earlier refills and pay for their generation again.
+        """
+        with self.lock:
+            uses = Counter(self.lookups)
+        ranked = sorted(dict.fromkeys(keys), key=lambda key: -uses[key])[:self.max_keys]
+        for key in ranked:
+            self.prefetch(key)
+        return ranked
+
+    def refill(self, key):
+        try:
+            with self.lock:
+                missing = self.variants - len(self.pool.get(key, []))
+            for _ in range(missing):
+                started = time.monotonic()
+                try:
+                    message = self.generate(*key)
+                except Exception:
+                    message = None
+                elapsed = time.monotonic() - started
+                with self.lock:
+                    self.stats['refill_time'] += elapsed
+                    if message is None:
+                        self.stats['refill_failures'] += 1
+                        break
+                    self.stats['refills'] += 1
+                    self.pool.setdefault(key, []).append((time.monotonic(), message))
+                    self.pool.move_to_end(key)
+                    while len(self.pool) > self.max_keys:
+                        self.pool.popitem(last=False)
+        finally:
+            with self.lock:
+                self.refilling.discard(key)
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats)
+            lookups = stats['hits'] + stats['misses']
+            attempts = stats['refills'] + stats['refill_failures']
+            stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+            stats['avg_refill_time'] = stats['refill_time'] / attempts if attempts else 0.0
+            stats['keys'] = len(self.pool)
+            return stats
@@ -0,0 +1,234 @@
+import random
+import sqlite3
+import threading
+import time
+
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS notification_outbox (
+        user_id TEXT NOT NULL,
+        source TEXT NOT NULL,
+        old_status TEXT,
+        new_status TEXT NOT NULL,
+        idempotency_key TEXT NOT NULL,
+        message TEXT,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        next_attempt_at REAL,
+        last_error TEXT,
+        created_at REAL NOT NULL,
+        updated_at REAL NOT NULL,
+        PRIMARY KEY (user_id, source)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_notification_outbox_due ON notification_outbox (next_attempt_at)",
+    """
+    CREATE TABLE IF NOT EXISTS notification_deliveries (
+        user_id TEXT NOT NULL,
+        source TEXT NOT NULL,
+        idempotency_key TEXT NOT NULL,
+        delivered_at REAL NOT NULL,
+        PRIMARY KEY (user_id, source)
+    )
+    """
+)
+
+
+def get_idempotency_key(source, user_id, old_status, new_status):
+    return f"{source}:{user_id}:{old_status}:{new_status}"
+
+
+class SqliteNotificationOutbox:
+    """Pending status change notifications, at most one per user and source, kept in a WAL-mode SQLite database
+
+    Enqueueing a change for a user who already has one pending from the same
+    source coalesces the two into a single old -> newest notification. The key
+    of each user's last delivered notification per source is kept, so a change
+    that was already delivered is not queued again.
+    """
+
+    def __init__(self, path, default_source, max_attempts=8, retry_base=30.0, retry_max=60 * 60.0):
+        self.path = path
+        self.default_source = default_source
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            legacy = self.rename_legacy_tables()
+            for statement in SCHEMA:
+                self.connection.execute(statement)
+            if legacy:
+                self.import_legacy_tables()
+            self.connection.execute("COMMIT")
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+
+    def rename_legacy_tables(self):
+        """Move aside tables from before notifications were keyed by source; returns True if there were any"""
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(notification_outbox)")}
+        if not columns or 'source' in columns:
+            return False
+        self.connection.execute("DROP INDEX IF EXISTS idx_notification_outbox_due")
+        self.connection.execute("ALTER TABLE notification_outbox RENAME TO legacy_notification_outbox")
+        self.connection.execute("ALTER TABLE notification_deliveries RENAME TO legacy_notification_deliveries")
+        return True
+
+    def import_legacy_tables(self):
+        # Every notification queued before sources existed came from the default source
+        self.connection.execute(
+            "INSERT INTO notification_outbox SELECT user_id, ?1, old_status, new_status, ?1 || ':' || idempotency_key, "
+            "message, attempts, next_attempt_at, last_error, created_at, updated_at FROM legacy_notification_outbox",
+            (self.default_source,)
+        )
+        self.connection.execute(
+            "INSERT INTO notification_deliveries SELECT user_id, ?1, ?1 || ':' || idempotency_key, delivered_at "
+            "FROM legacy_notification_deliveries",
+            (self.default_source,)
+        )
+        self.connection.execute("DROP TABLE legacy_notification_outbox")
+        self.connection.execute("DROP TABLE legacy_notification_deliveries")
+
+    def enqueue(self, user_id, source, old_status, new_status):
+        """Queue a notification; returns False if this exact change was already delivered"""
+        now = time.time()
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.connection.execute(
+                    "SELECT old_status FROM notification_outbox WHERE user_id = ? AND source = ?", (user_id, source)
+                ).fetchone()
+                if row is not None:
+                    old_status = row[0]
+                key = get_idempotency_key(source, user_id, old_status, new_status)
+                delivered = self.connection.execute(
+                    "SELECT 1 FROM notification_deliveries WHERE user_id = ? AND source = ? AND idempotency_key = ?",
+                    (user_id, source, key)
+                ).fetchone()
+                if delivered or old_status == new_status:
+                    self.connection.execute(
+                        "DELETE FROM notification_outbox WHERE user_id = ? AND source = ?", (user_id, source)
+                    )
+                else:
+                    self.connection.execute(
+                        "INSERT INTO notification_outbox "
+                        "(user_id, source, old_status, new_status, idempotency_key, next_attempt_at, created_at, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT (user_id, source) DO UPDATE SET new_status = excluded.new_status, "
+                        "idempotency_key = excluded.idempotency_key, message = NULL, attempts = 0, "
+                        "next_attempt_at = excluded.next_attempt_at, last_error = NULL, updated_at = excluded.updated_at "
+                        "WHERE idempotency_key != excluded.idempotency_key",
+                        (user_id, source, old_status, new_status, key, now, now, now)
+                    )
+                self.connection.execute("COMMIT")
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+        return not delivered
+
+    def get_due(self, limit):
+        """Return up to limit notifications whose next attempt is due, oldest first"""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT user_id, source, old_status, new_status, idempotency_key, message, attempts "
+                "FROM notification_outbox WHERE next_attempt_at <= ? ORDER BY created_at LIMIT ?",
+                (time.time(), limit)
+            ).fetchall()
+        return [
+            {'user_id': user_id, 'source': source, 'old_status': old_status, 'new_status': new_status,
+             'idempotency_key': key, 'message': message, 'attempts': attempts}
+            for user_id, source, old_status, new_status, key, message, attempts in rows
+        ]
+
+    def set_message(self, notification, message):
+        with self.lock:
+            self.connection.execute(
+                "UPDATE notification_outbox SET message = ? WHERE user_id = ? AND idempotency_key = ?",
+                (message, notification['user_id'], notification['idempotency_key'])
+            )
+
+    def complete(self, notification):
+        """Record a delivered notification; a change coalesced into it meanwhile stays queued from the new status"""
+        user_id = notification['user_id']
+        source = notification['source']
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+            try:
+                self.connection.execute(
+                    "INSERT INTO notification_deliveries (user_id, source, idempotency_key, delivered_at) "
+                    "VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (user_id, source) DO UPDATE SET idempotency_key = excluded.idempotency_key, "
+                    "delivered_at = excluded.delivered_at",
+                    (user_id, source, notification['idempotency_key'], time.time())
+                )
+                deleted = self.connection.execute(
+                    "DELETE FROM notification_outbox WHERE user_id = ? AND idempotency_key = ?",
+                    (user_id, notification['idempotency_key'])
+                ).rowcount
+                if not deleted:
+                    self.rebase(user_id, source, notification['new_status'])
+                self.connection.execute("COMMIT")
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+
+    def rebase(self, user_id, source, old_status):
+        row = self.connection.execute(
+            "SELECT new_status FROM notification_outbox WHERE user_id = ? AND source = ?", (user_id, source)
+        ).fetchone()
+        if row is None:
+            return
+        if row[0] == old_status:
+            self.connection.execute(
+                "DELETE FROM notification_outbox WHERE user_id = ? AND source = ?", (user_id, source)
+            )
+            return
+        self.connection.execute(
+            "UPDATE notification_outbox SET old_status = ?, idempotency_key = ? WHERE user_id = ? AND source = ?",
+            (old_status, get_idempotency_key(source, user_id, old_status, row[0]), user_id, source)
+        )
+
+    def retry(self, notification, error):
+        """Schedule another attempt with exponential backoff; after max_attempts the notification is parked"""
+        attempts = notification['attempts'] + 1
+        if attempts >= self.max_attempts:
+            next_attempt_at = None
+        else:
+            delay = min(self.retry_max, self.retry_base * 2 ** (attempts - 1))
+            next_attempt_at = time.time() + delay * random.uniform(0.8, 1.2)
+        with self.lock:
+            self.connection.execute(
+                "UPDATE notification_outbox SET attempts = ?, next_attempt_at = ?, last_error = ?, updated_at = ? "
+                "WHERE user_id = ? AND idempotency_key = ?",
+                (attempts, next_attempt_at, str(error)[:500], time.time(),
+                 notification['user_id'], notification['idempotency_key'])
+            )
+        return next_attempt_at is not None
+
+    def discard(self, notification):
+        with self.lock:
+            self.connection.execute(
+                "DELETE FROM notification_outbox WHERE user_id = ? AND idempotency_key = ?",
+                (notification['user_id'], notification['idempotency_key'])
+            )
+
+    def get_stats(self):
+        with self.lock:
+            pending, parked, oldest = self.connection.execute(
+                "SELECT COUNT(next_attempt_at), COUNT(*) - COUNT(next_attempt_at), "
+                "MIN(CASE WHEN next_attempt_at IS NOT NULL THEN created_at END) FROM notification_outbox"
+            ).fetchone()
+        return {
+            'pending': pending,
+            'parked': parked,
+            'oldest_age': time.time() - oldest if oldest is not None else 0.0
+        }
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,38 @@
+import random
+import threading
+
+
+class AdaptiveCadence:
+    """Polling interval that drops to min_interval after a change and backs off exponentially while nothing changes"""
+
+    def __init__(self, min_interval=60.0, max_interval=30 * 60.0, backoff=2.0, jitter=0.1):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Polling bounds must satisfy 0 < min_interval <= max_interval")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+        self.interval = min_interval
+        self.idle_polls = 0
+        self.lock = threading.Lock()
+
+    def record(self, changed):
+        """Update the interval after a poll and return it"""
+        with self.lock:
+            if changed:
+                self.idle_polls = 0
+                self.interval = self.min_interval
+            else:
+                self.idle_polls += 1
+                self.interval = min(self.max_interval, self.interval * self.backoff)
+            return self.interval
+
+    def next_delay(self):
+        """The current interval with jitter applied, kept within the bounds"""
+        with self.lock:
+            delay = self.interval * (1 + random.uniform(-self.jitter, self.jitter))
+            return min(self.max_interval, max(self.min_interval, delay))
+
+    def get_stats(self):
+        with self.lock:
+            return {'interval': self.interval, 'idle_polls': self.idle_polls}
@@ -0,0 +1,56 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class RateLimiter:
+    """Token buckets keyed by client, bounded to max_buckets with least recently used eviction
+
+    A bucket refills at rate tokens per second up to capacity. A bucket left
+    idle until it is full again is the same as a new one, so evicting the
+    least recently used buckets only forgets clients that are within budget.
+    """
+
+    def __init__(self, max_buckets=50000):
+        self.max_buckets = max_buckets
+        self.buckets = OrderedDict()
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def acquire(self, keys, rate, capacity):
+        """Take one token from every bucket in keys
+
+        Returns (None, 0) when the request may proceed, otherwise the key of
+        an empty bucket and the seconds until it holds a token again. A
+        rejected request takes nothing from the other buckets.
+        """
+        now = time.monotonic()
+        with self.lock:
+            levels = []
+            for key in keys:
+                bucket = self.buckets.get(key)
+                if bucket is None:
+                    levels.append(capacity)
+                else:
+                    tokens, updated = bucket
+                    levels.append(min(capacity, tokens + (now - updated) * rate))
+
+            for key, tokens in zip(keys, levels):
+                if tokens < 1:
+                    # Keep clients being rejected at the recent end, so they are the last to be forgotten
+                    for touched in keys:
+                        if touched in self.buckets:
+                            self.buckets.move_to_end(touched)
+                    return key, (1 - tokens) / rate
+
+            for key, tokens in zip(keys, levels):
+                self.buckets[key] = (tokens - 1, now)
+                self.buckets.move_to_end(key)
+            while len(self.buckets) > self.max_buckets:
+                self.buckets.popitem(last=False)
+                self.evictions += 1
+        return None, 0.0
+
+    def get_stats(self):
+        with self.lock:
+            return {'buckets': len(self.buckets), 'evictions': self.evictions}
@@ -0,0 +1,194 @@
+import fcntl
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+
+SNAPSHOT_MAGIC = b'SBSNAP02'
+# magic, version, published_at, cache_seconds, submission_count, meta bytes, tables bytes, codes bytes
+SNAPSHOT_HEADER = struct.Struct('<8sQddQQQQ')
+
+
+class LeaderLock:
+    """Elects one process as scheduler leader by holding an exclusive flock on a file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.fd = None
+        self.lock = threading.Lock()
+
+    def is_leader(self):
+        """Return True if this process holds the lock, trying to take it over if not"""
+        with self.lock:
+            if self.fd is not None:
+                return True
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                return False
+            os.ftruncate(fd, 0)
+            os.write(fd, f"{os.getpid()}\n".encode())
+            self.fd = fd
+            return True
+
+    def release(self):
+        with self.lock:
+            if self.fd is not None:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+                os.close(self.fd)
+                self.fd = None
+
+
+class SharedSnapshotFile:
+    """Submissions snapshot shared between worker processes and restarts through an atomically replaced, memory-mapped file
+
+    Slots and status codes are interned per process, so the file carries the
+    publisher's Slack ID and status tables alongside its codes. A revalidation
+    that kept the content only rewrites the fixed-size header in place.
+    """
+
+    def __init__(self, path, poll_interval=1.0):
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self.poll_interval = poll_interval
+        self.version = 0
+        self.file_identity = None
+        self.next_poll = 0.0
+        self.state_lock = threading.Lock()
+
+    @contextmanager
+    def lock(self):
+        """Hold the cross-process lock that serializes fetching and publishing"""
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield self
+        finally:
+            os.close(fd)
+
+    def get_file_identity(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def poll(self, known_hash=None):
+        """Cheap, throttled check for a newer snapshot; returns it like read() or None"""
+        now = time.monotonic()
+        with self.state_lock:
+            if now < self.next_poll:
+                return None
+            self.next_poll = now + self.poll_interval
+        if self.get_file_identity() == self.file_identity:
+            return None
+        return self.read(known_hash)
+
+    def read(self, known_hash=None):
+        """Return the published snapshot if it is newer than the last one seen, else None
+
+        When its content hash equals known_hash the tables and codes are not decoded.
+        """
+        identity = self.get_file_identity()
+        try:
+            with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                magic, version, published_at, cache_seconds, submission_count, meta_length, tables_length, codes_length = \
+                    SNAPSHOT_HEADER.unpack_from(mapped, 0)
+                if magic != SNAPSHOT_MAGIC:
+                    raise ValueError(f"{self.path} is not a shared snapshot")
+                if len(mapped) < SNAPSHOT_HEADER.size + meta_length + tables_length + codes_length:
+                    raise ValueError(f"{self.path} is truncated")
+                with self.state_lock:
+                    self.file_identity = identity
+                    if version <= self.version:
+                        return None
+                    self.version = version
+
+                offset = SNAPSHOT_HEADER.size
+                meta = json.loads(mapped[offset:offset + meta_length])
+                shared = {
+                    'version': version,
+                    'published_at': published_at,
+                    'cache_seconds': cache_seconds,
+                    'submission_count': submission_count,
+                    'meta': meta,
+                    'slack_ids': None,
+                    'statuses': None,
+                    'codes': None
+                }
+                if known_hash is not None and meta.get('content_hash') == known_hash:
+                    return shared
+
+                offset += meta_length
+                tables = json.loads(mapped[offset:offset + tables_length])
+                offset += tables_length
+                codes = array('h')
+                codes.frombytes(mapped[offset:offset + codes_length])
+                shared.update(slack_ids=tables['slack_ids'], statuses=tables['statuses'], codes=codes)
+                return shared
+        except (FileNotFoundError, ValueError, struct.error):
+            return None
+
+    def read_version(self):
+        try:
+            with open(self.path, 'rb') as f:
+                header = f.read(SNAPSHOT_HEADER.size)
+        except FileNotFoundError:
+            return 0
+        if len(header) < SNAPSHOT_HEADER.size or header[:8] != SNAPSHOT_MAGIC:
+            return 0
+        return SNAPSHOT_HEADER.unpack(header)[1]
+
+    def refresh(self, published_at, cache_seconds, meta):
+        """Mark the published snapshot as revalidated without rewriting it; the caller must hold lock()
+
+        Returns False, leaving the file alone, unless it holds exactly meta, in
+        which case only the header's version, timestamp and TTL are updated.
+        """
+        try:
+            with open(self.path, 'r+b') as f:
+                header = f.read(SNAPSHOT_HEADER.size)
+                if len(header) < SNAPSHOT_HEADER.size or header[:8] != SNAPSHOT_MAGIC:
+                    return False
+                _, version, _, _, submission_count, meta_length, tables_length, codes_length = \
+                    SNAPSHOT_HEADER.unpack(header)
+                encoded_meta = json.dumps(meta).encode()
+                if f.read(meta_length) != encoded_meta:
+                    return False
+                version += 1
+                f.seek(0)
+                f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, version, published_at, cache_seconds, submission_count,
+                                             meta_length, tables_length, codes_length))
+        except FileNotFoundError:
+            return False
+        with self.state_lock:
+            self.version = version
+            self.file_identity = self.get_file_identity()
+        return True
+
+    def publish(self, codes, slack_ids, statuses, submission_count, published_at, cache_seconds, meta):
+        """Write a new version of the snapshot; the caller must hold lock()"""
+        version = self.read_version() + 1
+        meta = json.dumps(meta).encode()
+        tables = json.dumps({'slack_ids': slack_ids, 'statuses': statuses}).encode()
+        codes = codes.tobytes()
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, version, published_at, cache_seconds, submission_count,
+                                         len(meta), len(tables), len(codes)))
+            f.write(meta)
+            f.write(tables)
+            f.write(codes)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        with self.state_lock:
+            self.version = version
+            self.file_identity = self.get_file_identity()
+        return version
@@ -0,0 +1,256 @@
+import random
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from urllib.error import URLError
+
+from slack_sdk.errors import SlackApiError
+from slack_sdk.web.slack_response import SlackResponse
+
+# (sustained requests per second, burst size) for each Slack rate limit tier.
+# chat.postMessage is "special": roughly one message per second per channel with
+# a higher workspace-wide ceiling, and every DM we send goes to a different channel.
+SLACK_TIER_LIMITS = {
+    1: (1 / 60, 1),
+    2: (20 / 60, 5),
+    3: (50 / 60, 10),
+    4: (100 / 60, 20),
+    'post': (5, 20)
+}
+
+SLACK_METHOD_TIERS = {
+    'auth_test': 4,
+    'chat_postMessage': 'post',
+    'chat_update': 3,
+    'chat_delete': 3,
+    'conversations_history': 3,
+    'views_publish': 4,
+    'users_info': 4,
+    'users_list': 2
+}
+
+DEFAULT_SLACK_TIER = 3
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, timeout=None):
+        """Block until a token is available; False if none becomes available within timeout seconds"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now >= self.updated:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return True
+                    wait = (1 - self.tokens) / self.rate
+                else:
+                    wait = self.updated - now
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Empty the bucket and stop refilling it for the given number of seconds"""
+        with self.lock:
+            self.tokens = 0
+            self.updated = max(self.updated, time.monotonic() + seconds)
+
+
+class SlackDispatcher:
+    def __init__(self, max_workers=8, max_retries=3, on_record=None):
+        self.max_retries = max_retries
+        self.on_record = on_record
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='slack-dispatch')
+        self.buckets = {}
+        self.stats = {}
+        self.lock = threading.Lock()
+
+    def get_bucket(self, method):
+        with self.lock:
+            bucket = self.buckets.get(method)
+            if bucket is None:
+                rate, capacity = SLACK_TIER_LIMITS[SLACK_METHOD_TIERS.get(method, DEFAULT_SLACK_TIER)]
+                bucket = self.buckets[method] = TokenBucket(rate, capacity)
+            return bucket
+
+    def record(self, method, elapsed, error=False, retried=False):
+        with self.lock:
+            stats = self.stats.get(method)
+            if stats is None:
+                stats = self.stats[method] = {'calls': 0, 'errors': 0, 'retries': 0, 'total_time': 0.0, 'max_time': 0.0}
+            stats['calls'] += 1
+            stats['total_time'] += elapsed
+            stats['max_time'] = max(stats['max_time'], elapsed)
+            if error:
+                stats['errors'] += 1
+            if retried:
+                stats['retries'] += 1
+        if self.on_record is not None:
+            self.on_record(method, elapsed, error)
+
+    def get_stats(self):
+        with self.lock:
+            return {
+                method: dict(stats, avg_time=stats['total_time'] / stats['calls'])
+                for method, stats in self.stats.items()
+            }
+
+    def is_rate_limited(self, error):
+        if not isinstance(error, SlackApiError):
+            return False
+        return getattr(error.response, 'status_code', None) == 429 or error.response.get('error') == 'ratelimited'
+
+    def get_retry_delay(self, error, attempt):
+        if isinstance(error, SlackApiError):
+            response = error.response
+            status_code = getattr(response, 'status_code', None)
+            if self.is_rate_limited(error):
+                headers = {key.lower(): value for key, value in (getattr(response, 'headers', None) or {}).items()}
+                retry_after = headers.get('retry-after', 1)
+                if isinstance(retry_after, list):
+                    retry_after = retry_after[0]
+                try:
+                    return max(float(retry_after), 0.0)
+                except (TypeError, ValueError):
+                    return 1.0
+            if status_code is None or status_code < 500:
+                return None
+        return min(30.0, 2 ** attempt) + random.uniform(0, 0.5)
+
+    def call(self, client, method, *, max_retries=None, max_wait=None, **kwargs):
+        """Call a Slack Web API method on the current thread, rate limited and retried
+
+        max_retries overrides the dispatcher's retry count. max_wait bounds how
+        long to wait for the rate limiter; TimeoutError is raised past it.
+        """
+        if max_retries is None:
+            max_retries = self.max_retries
+        bucket = self.get_bucket(method)
+        attempt = 0
+        while True:
+            if not bucket.acquire(max_wait):
+                raise TimeoutError(f"{method} is rate limited")
+            started = time.monotonic()
+            try:
+                response = getattr(client, method)(**kwargs)
+            except (SlackApiError, URLError, ConnectionError, TimeoutError) as e:
+                delay = self.get_retry_delay(e, attempt)
+                will_retry = delay is not None and attempt < max_retries
+                self.record(method, time.monotonic() - started, error=True, retried=will_retry)
+                if not will_retry:
+                    if self.is_rate_limited(e) and delay is not None:
+                        bucket.pause(delay)
+                    raise
+                attempt += 1
+                if self.is_rate_limited(e):
+                    bucket.pause(delay)
+                else:
+                    time.sleep(delay)
+                continue
+            self.record(method, time.monotonic() - started)
+            return response
+
+    def submit(self, fn, *args, **kwargs):
+        return self.executor.submit(fn, *args, **kwargs)
+
+    def submit_call(self, client, method, **kwargs):
+        return self.executor.submit(self.call, client, method, **kwargs)
+
+
+class SessionSlackClient:
+    """Read-only Slack Web API client on a pooled requests session, usable with SlackDispatcher.call
+
+    Methods are looked up like WebClient's (users_info -> users.info) and
+    raise SlackApiError for responses that are not ok.
+    """
+
+    def __init__(self, session, token, base_url, timeout=5.0):
+        self.session = session
+        self.token = token
+        self.base_url = base_url
+        self.timeout = timeout
+
+    def __getattr__(self, method):
+        if method.startswith('_'):
+            raise AttributeError(method)
+        return lambda **kwargs: self.api_call(method.replace('_', '.'), kwargs)
+
+    def api_call(self, api_method, params):
+        url = f"{self.base_url}{api_method}"
+        response = self.session.get(url, params=params, headers={'Authorization': f'Bearer {self.token}'},
+                                    timeout=self.timeout)
+        try:
+            data = response.json()
+        except ValueError:
+            data = {'ok': False, 'error': f'http_{response.status_code}'}
+        result = SlackResponse(client=self, http_verb='GET', api_url=url, req_args={'params': params},
+                               data=data, headers=dict(response.headers), status_code=response.status_code)
+        if response.status_code != 200 or not data.get('ok'):
+            raise SlackApiError(f"{api_method} failed: {data.get('error')}", result)
+        return result
+
+
+class BoundedExecutor(Executor):
+    """Thread pool with a bounded backlog that tracks queue depth and how long work waits to start"""
+
+    def __init__(self, max_workers=8, max_queue=256, thread_name_prefix='', on_record=None):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self.max_pending = max_workers + max_queue
+        self.on_record = on_record
+        self.lock = threading.Lock()
+        self.stats = {'submitted': 0, 'rejected': 0, 'completed': 0, 'failed': 0,
+                      'queued': 0, 'running': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+
+    def submit(self, fn, *args, **kwargs):
+        """Queue fn; when the backlog is full the returned future fails instead of blocking the caller"""
+        with self.lock:
+            if self.stats['queued'] + self.stats['running'] >= self.max_pending:
+                self.stats['rejected'] += 1
+                future = Future()
+                future.set_exception(RuntimeError("Background queue is full"))
+                return future
+            self.stats['submitted'] += 1
+            self.stats['queued'] += 1
+        return self.executor.submit(self.run, time.monotonic(), fn, args, kwargs)
+
+    def run(self, submitted, fn, args, kwargs):
+        started = time.monotonic()
+        waited = started - submitted
+        with self.lock:
+            self.stats['queued'] -= 1
+            self.stats['running'] += 1
+            self.stats['total_wait'] += waited
+            self.stats['max_wait'] = max(self.stats['max_wait'], waited)
+        error = False
+        try:
+            return fn(*args, **kwargs)
+        except BaseException:
+            error = True
+            raise
+        finally:
+            elapsed = time.monotonic() - started
+            with self.lock:
+                self.stats['running'] -= 1
+                self.stats['failed' if error else 'completed'] += 1
+            if self.on_record is not None:
+                self.on_record(waited, elapsed, error)
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats)
+        started = stats['completed'] + stats['failed'] + stats['running']
+        stats['avg_wait'] = stats['total_wait'] / started if started else 0.0
+        return stats
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.executor.shutdown(wait=wait, cancel_futures=cancel_futures)
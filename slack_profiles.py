@@ -0,0 +1,92 @@
+import threading
+
+from slack_sdk.errors import SlackApiError
+
+from ttl_cache import TTLCache
+
+UNKNOWN_USER = object()
+UNKNOWN_USER_ERRORS = {'user_not_found', 'users_not_found', 'invalid_user'}
+
+
+class SlackProfileCache:
+    """Name and avatar of Slack users, cached with LRU and TTL eviction
+
+    IDs Slack does not know are remembered for negative_ttl seconds so
+    repeated logins with a mistyped ID do not reach Slack either.
+    """
+
+    def __init__(self, call, max_size=10000, ttl=6 * 60 * 60, negative_ttl=10 * 60, page_size=200):
+        self.call = call
+        self.negative_ttl = negative_ttl
+        self.page_size = page_size
+        self.profiles = TTLCache(max_size, ttl)
+        self.stats = {'hit': 0, 'negative_hit': 0, 'miss': 0, 'error': 0, 'warmed': 0}
+        self.lock = threading.Lock()
+
+    def count(self, result, amount=1):
+        with self.lock:
+            self.stats[result] += amount
+
+    def get(self, slack_id, call=None):
+        """Return {'name', 'image'} for slack_id, or None if Slack does not know the user or cannot be reached
+
+        call replaces the cache's own call for this lookup, for example one that does not retry.
+        """
+        profile = self.profiles.get(slack_id)
+        if profile is UNKNOWN_USER:
+            self.count('negative_hit')
+            return None
+        if profile is not None:
+            self.count('hit')
+            return profile
+
+        self.count('miss')
+        try:
+            response = (call or self.call)('users_info', user=slack_id)
+        except SlackApiError as e:
+            if e.response.get('error') in UNKNOWN_USER_ERRORS:
+                self.profiles.set(slack_id, UNKNOWN_USER, ttl=self.negative_ttl)
+            else:
+                self.count('error')
+            return None
+        except Exception:
+            self.count('error')
+            return None
+        return self.store(response['user'])
+
+    def is_cached(self, slack_id):
+        """True if slack_id has a cached profile or is remembered as unknown"""
+        return self.profiles.get(slack_id) is not None
+
+    def store(self, user):
+        profile = {
+            'name': user.get('real_name') or user.get('profile', {}).get('real_name') or user.get('name'),
+            'image': user.get('profile', {}).get('image_192', '')
+        }
+        self.profiles.set(user['id'], profile)
+        return profile
+
+    def warm(self, slack_ids):
+        """Cache the profiles of slack_ids from one paginated pass over users.list; returns how many were found"""
+        wanted = set(slack_ids)
+        found = 0
+        cursor = None
+        while wanted:
+            kwargs = {'limit': self.page_size}
+            if cursor:
+                kwargs['cursor'] = cursor
+            response = self.call('users_list', **kwargs)
+            for user in response.get('members', []):
+                if user.get('id') in wanted and not user.get('deleted'):
+                    wanted.discard(user['id'])
+                    self.store(user)
+                    found += 1
+            cursor = response.get('response_metadata', {}).get('next_cursor')
+            if not cursor:
+                break
+        self.count('warmed', found)
+        return found
+
+    def get_stats(self):
+        with self.lock:
+            return dict(self.stats, size=len(self.profiles))
@@ -0,0 +1,239 @@
+import codecs
+import json
+import re
+import threading
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SLACK_ID_PATTERN = re.compile(r'[A-Z0-9]+')
+STATUS_MISSING = -1
+NUMBER_CONTINUATION = frozenset('0123456789.eE+-')
+
+# Statuses and Slack IDs are interned once for the life of the process, so every
+# snapshot can be stored as a flat array of status codes indexed by Slack ID slot.
+status_codes = {}
+status_values = []
+slack_id_slots = {}
+slot_slack_ids = []
+intern_lock = threading.Lock()
+
+
+def intern_status_code(status):
+    code = status_codes.get(status)
+    if code is None:
+        code = len(status_values)
+        status_codes[status] = code
+        status_values.append(status)
+    return code
+
+
+def get_slack_ids(slack_real_id_field):
+    if isinstance(slack_real_id_field, str):
+        return SLACK_ID_PATTERN.findall(slack_real_id_field)
+    if isinstance(slack_real_id_field, (list, tuple)):
+        ids = []
+        for value in slack_real_id_field:
+            if isinstance(value, str):
+                ids.extend(SLACK_ID_PATTERN.findall(value))
+        return ids
+    return []
+
+
+class SubmissionSnapshot:
+    """Projected submissions feed: one int16 status code per Slack ID slot"""
+
+    __slots__ = ('codes', 'submission_count', 'version', 'created_at')
+
+    def __init__(self, codes, submission_count, version=None, created_at=None):
+        self.codes = codes
+        self.submission_count = submission_count
+        # Content version (a prefix of the feed's hash) and when this content was first seen
+        self.version = version
+        self.created_at = created_at
+
+    def get_code(self, slack_id):
+        slot = slack_id_slots.get(slack_id)
+        if slot is None or slot >= len(self.codes):
+            return STATUS_MISSING
+        return self.codes[slot]
+
+    def get_status(self, slack_id):
+        code = self.get_code(slack_id)
+        if code == STATUS_MISSING:
+            return None
+        return status_values[code]
+
+    def get_nbytes(self):
+        return self.codes.itemsize * len(self.codes)
+
+
+def build_snapshot(submissions, batch_size=1024):
+    """Project (slackRealId, status) out of each submission; the first submission for a Slack ID wins
+
+    The feed is parsed outside intern_lock and interned in batches, so snapshots
+    of several feeds can be built at the same time.
+    """
+    codes = array('h')
+    submission_count = 0
+    batch = []
+    for submission in submissions:
+        submission_count += 1
+        slack_real_id = submission.get('slackRealId')
+        if not slack_real_id:
+            continue
+        status = submission.get('status', 'Unknown')
+        batch.append((status if isinstance(status, str) else 'Unknown', get_slack_ids(slack_real_id)))
+        if len(batch) >= batch_size:
+            intern_batch(codes, batch)
+            batch.clear()
+    intern_batch(codes, batch)
+    return SubmissionSnapshot(codes, submission_count)
+
+
+def intern_batch(codes, batch):
+    with intern_lock:
+        for status, slack_ids in batch:
+            code = intern_status_code(status)
+            for slack_id in slack_ids:
+                slot = slack_id_slots.get(slack_id)
+                if slot is None:
+                    slot = slack_id_slots[slack_id] = len(slot_slack_ids)
+                    slot_slack_ids.append(slack_id)
+                if slot == len(codes):
+                    codes.append(code)
+                elif slot > len(codes):
+                    # Slots interned by another feed since this one was last extended
+                    codes.extend(array('h', [STATUS_MISSING]) * (slot - len(codes)))
+                    codes.append(code)
+                elif codes[slot] == STATUS_MISSING:
+                    codes[slot] = code
+
+
+def export_tables(slot_count):
+    """Return the Slack ID and status tables needed to read codes outside this process"""
+    with intern_lock:
+        return slot_slack_ids[:slot_count], list(status_values)
+
+
+def import_snapshot(slack_ids, statuses, codes, submission_count):
+    """Rebuild a snapshot published with another process's Slack ID and status tables"""
+    with intern_lock:
+        status_map = [intern_status_code(status) for status in statuses]
+        local_codes = array('h', [STATUS_MISSING]) * len(slot_slack_ids)
+        for slack_id, code in zip(slack_ids, codes):
+            local_code = STATUS_MISSING if code == STATUS_MISSING else status_map[code]
+            slot = slack_id_slots.get(slack_id)
+            if slot is None:
+                slot = slack_id_slots[slack_id] = len(slot_slack_ids)
+                slot_slack_ids.append(slack_id)
+                local_codes.append(local_code)
+            else:
+                local_codes[slot] = local_code
+        return SubmissionSnapshot(local_codes, submission_count)
+
+
+def diff_status_codes(old_codes, new_codes):
+    """Return the slots whose status code differs between two snapshots"""
+    length = len(new_codes)
+    if len(old_codes) < length:
+        old_codes = old_codes + array('h', [STATUS_MISSING]) * (length - len(old_codes))
+    elif len(old_codes) > length:
+        old_codes = old_codes[:length]
+
+    if np is not None:
+        old = np.frombuffer(old_codes, dtype=np.int16)
+        new = np.frombuffer(new_codes, dtype=np.int16)
+        return np.flatnonzero(old != new).tolist()
+    return [slot for slot, (old, new) in enumerate(zip(old_codes, new_codes)) if old != new]
+
+
+class JsonStreamReader:
+    """Decodes JSON values one at a time from an iterable of byte chunks"""
+
+    def __init__(self, chunks, compact_after=1 << 16):
+        self.chunks = iter(chunks)
+        self.text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.json_decoder = json.JSONDecoder()
+        self.compact_after = compact_after
+        self.buffer = ''
+        self.pos = 0
+        self.exhausted = False
+
+    def fill(self):
+        if self.exhausted:
+            return False
+        if self.pos > self.compact_after:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        for chunk in self.chunks:
+            text = self.text_decoder.decode(chunk)
+            if text:
+                self.buffer += text
+                return True
+        self.buffer += self.text_decoder.decode(b'', final=True)
+        self.exhausted = True
+        return False
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def expect(self, characters):
+        character = self.peek()
+        if character not in characters:
+            raise ValueError(f"Expected one of {characters!r} at offset {self.pos}, got {character!r}")
+        self.pos += 1
+        return character
+
+    def decode_value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number near the buffer edge may continue in the next chunk: "12" before "5",
+            # or "12" decoded from "12." or "1e" whose fraction or exponent has not arrived yet
+            if (isinstance(value, (int, float)) and not isinstance(value, bool)
+                    and all(character in NUMBER_CONTINUATION for character in self.buffer[end:])
+                    and self.fill()):
+                continue
+            self.pos = end
+            return value
+
+
+def iter_submissions(chunks):
+    """Yield each element of the top-level "submissions" array without holding the whole document"""
+    reader = JsonStreamReader(chunks)
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+    while True:
+        key = reader.decode_value()
+        reader.expect(':')
+        if key == 'submissions' and reader.peek() == '[':
+            reader.expect('[')
+            if reader.peek() == ']':
+                reader.expect(']')
+            else:
+                while True:
+                    submission = reader.decode_value()
+                    if isinstance(submission, dict):
+                        yield submission
+                    if reader.expect(',]') == ']':
+                        break
+        else:
+            reader.decode_value()
+        if reader.expect(',}') == '}':
+            return
@@ -0,0 +1,96 @@
+import json
+import queue
+import threading
+import time
+
+
+class StatusStreamHub:
+    """Fans status updates out to the server-sent event streams open for each key, such as a (user, source) pair"""
+
+    def __init__(self, max_streams=64, heartbeat=25.0, max_duration=15 * 60.0, retry_ms=5000,
+                 watch=None, watch_interval=1.0):
+        self.max_streams = max_streams
+        self.heartbeat = heartbeat
+        self.max_duration = max_duration
+        self.retry_ms = retry_ms
+        # Called every watch_interval seconds while any stream is open, so updates made by other processes are seen
+        self.watch = watch
+        self.watch_interval = watch_interval
+        self.watcher = None
+        self.subscribers = {}
+        self.stream_count = 0
+        self.stats = {'opened': 0, 'rejected': 0, 'events': 0}
+        self.lock = threading.Lock()
+
+    def subscribe(self, key):
+        """Return a queue that receives the key's updates, or None when the stream limit is reached"""
+        with self.lock:
+            if self.stream_count >= self.max_streams:
+                self.stats['rejected'] += 1
+                return None
+            events = queue.SimpleQueue()
+            self.subscribers.setdefault(key, set()).add(events)
+            self.stream_count += 1
+            self.stats['opened'] += 1
+            if self.watch is not None and self.watcher is None:
+                self.watcher = threading.Thread(target=self.run_watcher, name='status-stream-watcher', daemon=True)
+                self.watcher.start()
+            return events
+
+    def run_watcher(self):
+        while True:
+            time.sleep(self.watch_interval)
+            with self.lock:
+                if not self.stream_count:
+                    self.watcher = None
+                    return
+            self.watch()
+
+    def unsubscribe(self, key, events):
+        with self.lock:
+            streams = self.subscribers.get(key)
+            if streams is None or events not in streams:
+                return
+            streams.discard(events)
+            if not streams:
+                del self.subscribers[key]
+            self.stream_count -= 1
+
+    def get_keys(self):
+        with self.lock:
+            return list(self.subscribers)
+
+    def publish(self, key, event):
+        with self.lock:
+            streams = list(self.subscribers.get(key, ()))
+            self.stats['events'] += len(streams)
+        for events in streams:
+            events.put(event)
+
+    def stream(self, key, events, initial_event=None):
+        """Yield the SSE body for one subscriber until it disconnects or max_duration passes"""
+        try:
+            yield f"retry: {self.retry_ms}\n\n"
+            if initial_event is not None:
+                yield format_event('status', initial_event)
+            deadline = time.monotonic() + self.max_duration
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                try:
+                    event = events.get(timeout=min(self.heartbeat, remaining))
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_event('status', event)
+        finally:
+            self.unsubscribe(key, events)
+
+    def get_stats(self):
+        with self.lock:
+            return dict(self.stats, streams=self.stream_count, keys=len(self.subscribers))
+
+
+def format_event(name, data):
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n"
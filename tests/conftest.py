@@ -0,0 +1,28 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope='session')
+def stubs():
+    from bench.stubs import start_stubs
+    return start_stubs(100, slack_latency=0, ai_latency=0)
+
+
+@pytest.fixture(scope='session')
+def api(stubs, tmp_path_factory):
+    """api.py started against the local stand-ins, without its scheduler"""
+    from bench.hot_paths import get_api_env
+    workdir = str(tmp_path_factory.mktemp('api'))
+    os.environ.update(get_api_env(stubs, workdir))
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        import api
+        api.create_app({'START_SCHEDULER': False})
+    finally:
+        os.chdir(cwd)
+    return api
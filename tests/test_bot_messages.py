@@ -0,0 +1,21 @@
+from bench.stubs import make_slack_id
+
+
+def test_message_ref_is_dropped_with_the_tracked_user(api):
+    user_id = make_slack_id(40)
+    api.start_tracking(user_id, user_id, api.get_user_submission_status(user_id))
+    api.send_dm(api.get_slack_client(), user_id, 'first')
+    assert api.get_last_bot_message(user_id) is not None
+    api.stop_tracking(user_id)
+    assert api.get_last_bot_message(user_id) is None
+
+
+def test_untracked_user_keeps_no_message_ref(api, stubs):
+    user_id = make_slack_id(41)
+    api.send_dm(api.get_slack_client(), user_id, 'first')
+    assert api.get_last_bot_message(user_id) is None
+    calls = stubs['slack_calls']
+    start = len(calls)
+    api.send_dm(api.get_slack_client(), user_id, 'second')
+    # Without a reference the previous DM is found by scanning the history
+    assert 'conversations.history' in calls[start:]
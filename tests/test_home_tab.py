@@ -0,0 +1,29 @@
+from bench.stubs import make_slack_id
+
+
+def publishes(stubs, run):
+    calls = stubs['slack_calls']
+    start = len(calls)
+    run()
+    return calls[start:].count('views.publish')
+
+
+def test_unchanged_home_tab_is_skipped_with_one_worker(api, stubs):
+    user_id = make_slack_id(20)
+    api.start_tracking(user_id, user_id, api.get_user_submission_status(user_id))
+    try:
+        assert publishes(stubs, lambda: api.refresh_home_tabs([user_id])) == 1
+        assert publishes(stubs, lambda: api.refresh_home_tabs([user_id])) == 0
+    finally:
+        api.stop_tracking(user_id)
+
+
+def test_every_refresh_publishes_with_several_workers(api, stubs, monkeypatch):
+    monkeypatch.setitem(api.app.config, 'WEB_WORKERS', 2)
+    user_id = make_slack_id(21)
+    api.start_tracking(user_id, user_id, api.get_user_submission_status(user_id))
+    try:
+        assert publishes(stubs, lambda: api.refresh_home_tabs([user_id])) == 1
+        assert publishes(stubs, lambda: api.refresh_home_tabs([user_id])) == 1
+    finally:
+        api.stop_tracking(user_id)
@@ -0,0 +1,35 @@
+import time
+
+from bench.stubs import make_slack_id
+
+
+def test_rate_limited_login_uses_placeholder_without_retrying(api, stubs, monkeypatch):
+    handler = stubs['slack'].server.RequestHandlerClass
+    monkeypatch.setattr(handler, 'rate_limit_probability', 1.0)
+    fills = []
+    monkeypatch.setattr(api.slack_dispatcher, 'submit', lambda fn, *args: fills.append(args))
+    user_id = make_slack_id(50)
+    calls = stubs['slack_calls']
+    start = len(calls)
+
+    started = time.monotonic()
+    profile = api.get_login_profile(user_id)
+
+    assert time.monotonic() - started < 0.5
+    assert calls[start:].count('users.info') == 1
+    assert profile == {'name': f'Slack User - {user_id[:8]}', 'image': ''}
+    assert fills == [(user_id,)]
+    # Slack asked for a pause, so the next login does not reach it at all
+    assert api.get_login_profile(user_id)['name'] == f'Slack User - {user_id[:8]}'
+    assert calls[start:].count('users.info') == 1
+    # Drop the paused bucket so later lookups are not held back
+    api.slack_dispatcher.buckets.pop('users_info')
+
+
+def test_login_profile_is_cached(api, stubs):
+    user_id = make_slack_id(51)
+    assert api.get_login_profile(user_id)['name'] == f'Bench {user_id}'
+    calls = stubs['slack_calls']
+    start = len(calls)
+    assert api.get_login_profile(user_id)['name'] == f'Bench {user_id}'
+    assert 'users.info' not in calls[start:]
@@ -0,0 +1,34 @@
+import threading
+
+from message_pool import MessagePool
+
+
+def make_pool(max_keys):
+    generated = []
+    lock = threading.Lock()
+
+    def generate(status, old_status):
+        with lock:
+            generated.append((status, old_status))
+        return f'{old_status} -> {status}'
+
+    return MessagePool(generate, variants=1, max_keys=max_keys, workers=1), generated
+
+
+def test_warm_up_stays_within_pool_capacity():
+    pool, generated = make_pool(max_keys=4)
+    keys = [(f'S{i}', f'S{j}') for i in range(6) for j in range(6) if i != j]
+    warmed = pool.warm(keys)
+    pool.executor.shutdown(wait=True)
+    assert len(warmed) == 4
+    assert sorted(generated) == sorted(warmed)
+    assert pool.get_stats()['keys'] == 4
+
+
+def test_warm_up_prefers_recently_used_keys():
+    pool, generated = make_pool(max_keys=2)
+    for key in [('B', 'A'), ('C', 'A'), ('C', 'A'), ('C', 'B')]:
+        pool.get(key)
+    warmed = pool.warm([('B', 'A'), ('C', 'B'), ('C', 'A'), ('D', 'A')])
+    pool.executor.shutdown(wait=True)
+    assert warmed == [('C', 'A'), ('B', 'A')]
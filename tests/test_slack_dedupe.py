@@ -0,0 +1,55 @@
+import hashlib
+import hmac
+import json
+import time
+
+from bench.stubs import make_slack_id
+from delivery_log import SqliteDeliveryLog
+
+
+def post_event(client, body):
+    timestamp = str(int(time.time()))
+    signature = 'v0=' + hmac.new(b'bench', f'v0:{timestamp}:{body}'.encode(), hashlib.sha256).hexdigest()
+    return client.post('/slack/events', data=body, content_type='application/json', headers={
+        'X-Slack-Request-Timestamp': timestamp,
+        'X-Slack-Signature': signature,
+    })
+
+
+def test_delivery_log_is_shared_by_connections(tmp_path):
+    path = str(tmp_path / 'slack_deliveries.db')
+    first, second = SqliteDeliveryLog(path), SqliteDeliveryLog(path)
+    try:
+        first.add('event:Ev1')
+        assert second.contains('event:Ev1')
+        assert not second.contains('event:Ev2')
+    finally:
+        first.close()
+        second.close()
+
+
+def test_expired_delivery_is_unknown(tmp_path):
+    log = SqliteDeliveryLog(str(tmp_path / 'slack_deliveries.db'), ttl=0)
+    try:
+        log.add('event:Ev1')
+        assert not log.contains('event:Ev1')
+    finally:
+        log.close()
+
+
+def test_retry_handled_by_another_worker_is_acked(api, tmp_path, monkeypatch):
+    log = SqliteDeliveryLog(str(tmp_path / 'slack_deliveries.db'))
+    monkeypatch.setattr(api, 'slack_delivery_log', log)
+    body = json.dumps({'type': 'event_callback', 'event_id': 'EvShared1', 'team_id': 'T1',
+                       'event': {'type': 'app_home_opened', 'user': make_slack_id(30)}})
+    client = api.app.test_client()
+    try:
+        assert post_event(client, body).status_code == 200
+        assert log.contains('event:EvShared1')
+        # The retry reaches a worker whose own cache never saw the delivery
+        api.slack_delivery_cache.pop(('event', 'EvShared1'))
+        retry = post_event(client, body)
+        assert retry.status_code == 200
+        assert retry.headers.get('X-Slack-No-Retry') == '1'
+    finally:
+        log.close()
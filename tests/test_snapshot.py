@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from snapshot import JsonStreamReader, iter_submissions
+
+DOCUMENT = {
+    'total': 12.5,
+    'ratio': -0.25,
+    'scale': 1e-3,
+    'big': 6.02E+23,
+    'count': 1234,
+    'submissions': [
+        {'slackRealId': 'U1', 'status': '2– Approved', 'hoursSpent': 12.75},
+        {'slackRealId': 'U2', 'status': '1– Pending', 'hoursSpent': 3e2},
+        {'slackRealId': 'U3', 'status': '0– Denied', 'hoursSpent': 40}
+    ],
+    'score': 99.5
+}
+
+
+def split_at(data, position):
+    return [data[:position], data[position:]]
+
+
+@pytest.mark.parametrize('position', range(1, len(json.dumps(DOCUMENT).encode())))
+def test_iter_submissions_across_chunk_boundaries(position):
+    data = json.dumps(DOCUMENT).encode()
+    assert list(iter_submissions(split_at(data, position))) == DOCUMENT['submissions']
+
+
+@pytest.mark.parametrize('text, cut', [
+    ('12.5', 3),
+    ('12.5', 2),
+    ('1e-3', 1),
+    ('1e-3', 2),
+    ('6.02E+23', 5),
+    ('-0.25', 1)
+])
+def test_number_split_inside_fraction_or_exponent(text, cut):
+    data = f'[{text}]'.encode()
+    reader = JsonStreamReader(split_at(data, cut + 1))
+    reader.expect('[')
+    assert reader.decode_value() == json.loads(text)
+    assert reader.expect(']') == ']'
+
+
+def test_one_byte_chunks():
+    data = json.dumps(DOCUMENT).encode()
+    assert list(iter_submissions(data[i:i + 1] for i in range(len(data)))) == DOCUMENT['submissions']
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_WITHOUT_CREDENTIALS = """
+import os
+import api
+assert os.listdir('.') == [], os.listdir('.')
+assert api.slack_state['app'] is None
+try:
+    api.create_app({'START_SCHEDULER': False})
+except ValueError as e:
+    print(e)
+"""
+
+
+def test_import_needs_no_credentials_and_opens_nothing(tmp_path):
+    env = {key: value for key, value in os.environ.items() if not key.startswith(('SLACK_', 'FLASK_'))}
+    env['PYTHONPATH'] = ROOT
+    result = subprocess.run([sys.executable, '-c', IMPORT_WITHOUT_CREDENTIALS], cwd=tmp_path, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert 'SLACK_BOT_TOKEN environment variable is required' in result.stdout
+
+
+def test_create_app_rejects_unknown_settings(api):
+    with pytest.raises(ValueError, match='NOT_A_SETTING'):
+        api.create_app({'NOT_A_SETTING': 1})
+
+
+def test_later_create_app_returns_the_started_app(api):
+    assert api.create_app() is api.app
+    assert api.create_app({'START_SCHEDULER': False}) is api.app
+    assert api.slack_state['app'] is not None
+
+
+@pytest.mark.parametrize('config', [{'START_SCHEDULER': True}, {'TRACKED_USERS_DB': 'other.db'}])
+def test_later_create_app_rejects_different_settings(api, config):
+    with pytest.raises(ValueError, match='already called'):
+        api.create_app(config)
@@ -0,0 +1,60 @@
+import gzip
+import json
+
+
+def expire(source):
+    cache = source['cache']
+    cache['last_updated'] -= cache['cache_duration'] * 2
+
+
+def rewrite_feed(feed, submissions):
+    with feed.lock:
+        feed.generation += 1
+        feed.body = json.dumps({'submissions': submissions}).encode()
+        feed.gzip_body = gzip.compress(feed.body, compresslevel=1)
+        feed.etag = f'"gen-{feed.generation}"'
+
+
+def test_reordered_feed_is_not_a_status_change(api, stubs):
+    feed = stubs['feed']
+    api.check_status_changes()
+    previous_codes = api.default_source['cache']['data'].codes
+
+    submissions = json.loads(feed.body)['submissions']
+    submissions.reverse()
+    for submission in submissions:
+        submission['hoursSpent'] += 1
+    rewrite_feed(feed, submissions)
+    expire(api.default_source)
+
+    assert api.check_status_changes() is False
+    assert api.default_source['cache']['data'].codes is not previous_codes
+
+
+def test_cadence_backs_off_while_only_other_fields_change(api, stubs):
+    feed = stubs['feed']
+    api.check_status_changes()
+    cadence = api.AdaptiveCadence(min_interval=60, max_interval=960)
+
+    intervals = []
+    for _ in range(3):
+        submissions = json.loads(feed.body)['submissions']
+        for submission in submissions:
+            submission['hoursSpent'] += 1
+        rewrite_feed(feed, submissions)
+        expire(api.default_source)
+        intervals.append(cadence.record(api.check_status_changes()))
+
+    assert intervals == [120, 240, 480]
+
+
+def test_status_change_resets_cadence(api, stubs):
+    feed = stubs['feed']
+    api.check_status_changes()
+    cadence = api.AdaptiveCadence(min_interval=60, max_interval=960)
+    cadence.record(False)
+
+    feed.advance(0.1)
+    expire(api.default_source)
+
+    assert cadence.record(api.check_status_changes()) == 60
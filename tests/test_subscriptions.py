@@ -0,0 +1,39 @@
+from bench.stubs import make_slack_id
+
+
+def scan_subscribers(api, source):
+    return {user_id for user_id, user_data in api.tracked_users.items()
+            if api.get_source_state(user_data, source) is not None}
+
+
+def test_subscribers_follow_start_and_stop_tracking(api):
+    source = api.default_source
+    user_id = make_slack_id(7)
+    api.start_tracking(user_id, user_id, api.get_user_submission_status(user_id))
+    assert user_id in api.get_subscribers(source)
+
+    assert api.stop_tracking(user_id, source)
+    assert user_id not in api.get_subscribers(source)
+    assert user_id not in api.tracked_users
+
+
+def test_subscribers_are_a_snapshot(api):
+    source = api.default_source
+    user_id = make_slack_id(8)
+    subscribers = api.get_subscribers(source)
+    api.start_tracking(user_id, user_id, api.get_user_submission_status(user_id))
+    try:
+        assert user_id not in subscribers
+    finally:
+        api.stop_tracking(user_id)
+
+
+def test_rebuilt_index_matches_a_full_scan(api):
+    for i in range(10, 15):
+        user_id = make_slack_id(i)
+        api.start_tracking(user_id, user_id, api.get_user_submission_status(user_id))
+    api.stop_tracking(make_slack_id(12))
+    expected = scan_subscribers(api, api.default_source)
+    with api.tracked_users_lock:
+        api.index_subscriptions()
+    assert api.get_subscribers(api.default_source) == expected
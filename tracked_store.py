@@ -0,0 +1,166 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger('statusbuddy.tracked_store')
+
+
+class JsonTrackedUserStore:
+    """Keeps every tracked user in one JSON file, rewritten atomically on each save"""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.RLock()
+        self.users = {}
+        self.batch_depth = 0
+        self.dirty = False
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                self.users = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.users = {}
+        return self.users
+
+    def write(self):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(self.users, f, indent=2)
+        os.replace(temp_path, self.path)
+        self.dirty = False
+
+    def save_user(self, user_id, user_data):
+        with self.lock:
+            if user_data is None:
+                self.users.pop(user_id, None)
+            else:
+                self.users[user_id] = user_data
+            self.dirty = True
+            if not self.batch_depth:
+                self.write()
+
+    def save_all(self, users):
+        with self.lock:
+            self.users = users
+            self.write()
+
+    @contextmanager
+    def batch(self):
+        with self.lock:
+            self.batch_depth += 1
+            try:
+                yield self
+            finally:
+                self.batch_depth -= 1
+                if not self.batch_depth and self.dirty:
+                    self.write()
+
+
+class SqliteTrackedUserStore:
+    """Stores one row per tracked user in a WAL-mode SQLite database"""
+
+    def __init__(self, path, import_json_path=None):
+        self.path = path
+        self.import_json_path = import_json_path
+        self.lock = threading.RLock()
+        self.batch_depth = 0
+        self.data_version = None
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS tracked_users (
+                user_id TEXT PRIMARY KEY,
+                last_status TEXT,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_tracked_users_last_status ON tracked_users (last_status);
+            CREATE TABLE IF NOT EXISTS store_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+
+    def import_json(self):
+        imported = self.connection.execute(
+            "SELECT value FROM store_meta WHERE key = 'json_imported'"
+        ).fetchone()
+        if imported or not self.import_json_path:
+            return
+
+        users = JsonTrackedUserStore(self.import_json_path).load()
+        with self.batch():
+            for user_id, user_data in users.items():
+                self.save_user(user_id, user_data)
+            self.connection.execute(
+                "INSERT OR REPLACE INTO store_meta (key, value) VALUES ('json_imported', ?)",
+                (self.import_json_path,)
+            )
+        if users:
+            logger.info(f"Imported {len(users)} tracked users from {self.import_json_path}")
+
+    def load(self):
+        with self.lock:
+            self.import_json()
+            rows = self.connection.execute("SELECT user_id, data FROM tracked_users").fetchall()
+            self.data_version = self.connection.execute("PRAGMA data_version").fetchone()[0]
+        return {user_id: json.loads(data) for user_id, data in rows}
+
+    def has_external_changes(self):
+        """True when another process has committed changes since the last load()"""
+        with self.lock:
+            return self.connection.execute("PRAGMA data_version").fetchone()[0] != self.data_version
+
+    def save_user(self, user_id, user_data):
+        with self.batch():
+            if user_data is None:
+                self.connection.execute("DELETE FROM tracked_users WHERE user_id = ?", (user_id,))
+            else:
+                self.connection.execute(
+                    "INSERT INTO tracked_users (user_id, last_status, data) VALUES (?, ?, ?) "
+                    "ON CONFLICT (user_id) DO UPDATE SET last_status = excluded.last_status, data = excluded.data",
+                    (user_id, user_data.get('last_status'), json.dumps(user_data))
+                )
+
+    def save_all(self, users):
+        with self.batch():
+            stored_ids = {row[0] for row in self.connection.execute("SELECT user_id FROM tracked_users")}
+            for user_id in stored_ids - users.keys():
+                self.save_user(user_id, None)
+            for user_id, user_data in list(users.items()):
+                self.save_user(user_id, user_data)
+
+    @contextmanager
+    def batch(self):
+        """Group writes into a single transaction; nested batches join the outer one"""
+        with self.lock:
+            if not self.batch_depth:
+                self.connection.execute("BEGIN")
+            self.batch_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self.batch_depth -= 1
+                if not self.batch_depth:
+                    self.connection.execute("ROLLBACK")
+                raise
+            else:
+                self.batch_depth -= 1
+                if not self.batch_depth:
+                    self.connection.execute("COMMIT")
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+def create_tracked_user_store(backend, json_path, sqlite_path):
+    if backend == 'json':
+        return JsonTrackedUserStore(json_path)
+    if backend == 'sqlite':
+        return SqliteTrackedUserStore(sqlite_path, import_json_path=json_path)
+    raise ValueError(f"Unknown tracked user store backend: {backend}")
@@ -1,5 +1,91 @@
+import logging
+import os
+import signal
+import socket
+import sys
+from multiprocessing import get_context
+from multiprocessing.connection import wait
 from waitress import serve
-from api import app
+
+HOST = os.environ.get("HOST", "0.0.0.0")
+PORT = int(os.environ.get("PORT", "8721"))
+WEB_WORKERS = int(os.environ.get("WEB_WORKERS", "1"))
+# Each open dashboard event stream holds one thread, so keep this above SSE_MAX_STREAMS
+WEB_THREADS = int(os.environ.get("WEB_THREADS", "32"))
+
+# A worker that cannot start because of its settings exits with this, and is not restarted
+WORKER_CONFIG_ERROR = 3
+
+logger = logging.getLogger('statusbuddy.wsgi')
+
+
+def __getattr__(name):
+    # api is imported lazily so the multi-worker parent never starts its scheduler
+    if name == 'app':
+        from api import create_app
+        return create_app()
+    raise AttributeError(name)
+
+
+def serve_worker(listener):
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    try:
+        from api import create_app
+        app = create_app()
+    except ValueError as e:
+        logger.error(f"Worker could not start: {e}")
+        sys.exit(WORKER_CONFIG_ERROR)
+    serve(app, sockets=[listener], threads=WEB_THREADS)
+
+
+def serve_workers(count):
+    """Fork count worker processes that share one listening socket; returns the exit code for the parent"""
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind((HOST, PORT))
+    listener.listen(1024)
+
+    context = get_context('fork')
+    workers = {}
+    stopping = False
+    exit_code = 0
+
+    def start_worker():
+        worker = context.Process(target=serve_worker, args=(listener,), name='statusbuddy-worker')
+        worker.start()
+        workers[worker.sentinel] = worker
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for worker in workers.values():
+            worker.terminate()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for _ in range(count):
+        start_worker()
+
+    while workers:
+        for sentinel in wait(list(workers)):
+            worker = workers.pop(sentinel)
+            worker.join()
+            if worker.exitcode == WORKER_CONFIG_ERROR and not stopping:
+                logger.error("Stopping, a worker could not start with the current settings")
+                exit_code = WORKER_CONFIG_ERROR
+                stop(None, None)
+                continue
+            if not stopping:
+                logger.warning(f"Worker {worker.pid} exited with {worker.exitcode}, restarting")
+                start_worker()
+    return exit_code
+
 
 if __name__ == "__main__":
-    serve(app, host='0.0.0.0', port=8721)
+    logging.basicConfig(format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    if WEB_WORKERS > 1:
+        sys.exit(serve_workers(WEB_WORKERS))
+    else:
+        from api import create_app
+        serve(create_app(), host=HOST, port=PORT, threads=WEB_THREADS)